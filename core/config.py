@@ -4,12 +4,31 @@ Configuration management system for Picture Finder with security and validation.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 from core.log_writer import get_logger
 
 
+@lru_cache(maxsize=8)
+def _parse_config(raw: bytes) -> Dict[str, Any]:
+    """
+    Parse configuration file contents, reusing the result for identical contents.
+    
+    Keyed on the bytes themselves rather than on file metadata: on filesystems
+    with coarse timestamps a same-size rewrite can keep the same mtime, and
+    would otherwise return stale settings.
+    
+    Args:
+        raw: Configuration file contents
+        
+    Returns:
+        Parsed configuration data (shared; callers must not mutate it)
+    """
+    return json.loads(raw)
+
+
 @dataclass
 class SecuritySettings:
     """Security-related settings."""
@@ -22,6 +41,9 @@ class SecuritySettings:
     def __post_init__(self):
         if self.allowed_extensions is None:
             self.allowed_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp']
+        else:
+            # Never share the list with cached config data
+            self.allowed_extensions = list(self.allowed_extensions)
 
 
 @dataclass
@@ -59,7 +81,7 @@ class ProcessingSettings:
     recursive_scan: bool = False
     separate_videos: bool = True
     export_format: str = 'folders'  # 'folders' or 'zip'
-    zip_compression_level: int = 6
+    zip_compression_level: int = 1  # 1 fast, 6 balanced, 9 diminishing returns
     password_protect_zip: bool = False
     backup_originals: bool = False
     create_thumbnails: bool = False
@@ -99,8 +121,7 @@ class ConfigManager:
                 self.logger.log_info("No config file found, using defaults")
                 return False
             
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
+            data = _parse_config(self.config_file.read_bytes())
             
             # Update settings from loaded data
             if 'security' in data:
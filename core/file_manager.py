@@ -4,15 +4,111 @@ video separation, timestamped naming, and comprehensive error handling.
 """
 
 import os
+import stat
+import sys
 import shutil
+import tempfile
 import datetime
 import hashlib
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Set
+from typing import BinaryIO, Callable, List, Tuple, Optional, Dict, Set, Union
 import mimetypes
+import subprocess
 import zipfile
+import zlib
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
 from core.log_writer import get_logger
 
+try:
+    import py7zr
+    PY7ZR_AVAILABLE = True
+except ImportError:
+    PY7ZR_AVAILABLE = False
+
+# Appending pre-compressed ZIP entries means updating ZipFile's internal
+# bookkeeping (fp, start_dir, filelist, NameToInfo, _didModify) the way
+# ZipFile.write does. That state is not public API, so the parallel writer
+# is only used on the CPython versions it has been checked against.
+RAW_ZIP_WRITES_SUPPORTED = (
+    sys.implementation.name == 'cpython' and (3, 11) <= sys.version_info[:2] <= (3, 13)
+)
+
+
+def _fadvise(f, advice_name: str):
+    """
+    Pass a page-cache hint for a whole open file, where the platform supports it.
+    
+    Args:
+        f: Open file object
+        advice_name: Name of the os.POSIX_FADV_* constant to apply
+    """
+    advice = getattr(os, advice_name, None)
+    if advice is not None and hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, advice)
+        except OSError:
+            pass  # Hints are optional
+
+
+def _preallocate(f, size: int):
+    """
+    Reserve disk space for a file about to be written, where the platform supports it.
+    
+    Args:
+        f: File object open for writing
+        size: Number of bytes to reserve
+    """
+    if size > 0 and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError:
+            pass  # Filesystem without preallocation support
+
+
+def _set_compress_level(zinfo: zipfile.ZipInfo, level: Optional[int]):
+    """
+    Set the compression level of a ZIP entry opened with ZipFile.open(zinfo, 'w').
+    
+    Args:
+        zinfo: Entry to configure
+        level: Compression level, or None for the compressor's default
+    """
+    if sys.version_info >= (3, 13):
+        zinfo.compress_level = level
+    else:
+        zinfo._compresslevel = level  # Set the same way by ZipFile.write before 3.13
+
+
+def _deflate_file(file_path: str, compression_level: int,
+                  chunk_size: int = 1024 * 1024) -> Tuple[bytes, int, int]:
+    """
+    Compress a file into a raw DEFLATE stream for a ZIP entry.
+    
+    Runs in a worker process, so it must stay a module-level function. The
+    file is read in chunks, so only the compressed output is held in memory.
+    
+    Returns:
+        Tuple of (compressed_bytes, crc32, uncompressed_size)
+    """
+    # wbits=-15 produces raw DEFLATE without the zlib header/trailer, as ZIP expects
+    compressor = zlib.compressobj(compression_level, zlib.DEFLATED, -15)
+    parts = []
+    crc = 0
+    file_size = 0
+    
+    with open(file_path, 'rb') as f:
+        _fadvise(f, 'POSIX_FADV_SEQUENTIAL')
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            parts.append(compressor.compress(chunk))
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+        _fadvise(f, 'POSIX_FADV_DONTNEED')
+    
+    parts.append(compressor.flush())
+    return b''.join(parts), crc, file_size
+
 
 class FileManager:
     """Enhanced file manager with security, performance, and reliability features."""
@@ -23,9 +119,25 @@ class FileManager:
     # Supported image extensions
     IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp', '.heic', '.heif'}
     
+    # Files worth exporting; stray metadata such as .DS_Store or Thumbs.db is left out
+    EXPORT_EXTENSIONS = frozenset(IMAGE_EXTENSIONS | VIDEO_EXTENSIONS)
+    
+    # Formats that are already compressed and gain nothing from DEFLATE
+    PRECOMPRESSED_EXTENSIONS = {
+        '.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic', '.heif',
+        '.mp4', '.mov', '.m4v', '.mkv', '.webm', '.3gp'
+    }
+    
     # Large file threshold (50MB)
     LARGE_FILE_THRESHOLD = 50 * 1024 * 1024
     
+    # Read size when streaming files into a ZIP (zipfile's own copy loop uses 8KB)
+    ZIP_COPY_CHUNK = 1024 * 1024
+    
+    # Larger files are streamed in-process rather than compressed in a worker,
+    # whose result is held in memory and pickled back to this process
+    PARALLEL_DEFLATE_MAX_SIZE = 64 * 1024 * 1024
+    
     def __init__(self, base_output_dir: str = ".", recursive_scan: bool = False):
         """
         Initialize the file manager.
@@ -346,64 +458,176 @@ class FileManager:
         
         return processed_groups
     
-    def export_to_zip(self, source_dir: str, zip_path: str = None, 
-                     compression_level: int = 6, password: str = None) -> Optional[str]:
+    def is_precompressed_folder(self, source_dir: str, threshold: float = 0.5,
+                                file_paths: Optional[List[str]] = None) -> bool:
+        """
+        Check whether a folder consists mostly of already-compressed media.
+        
+        Only file sizes are read (via stat); no file is opened.
+        
+        Args:
+            source_dir: Directory to inspect
+            threshold: Minimum fraction of bytes held in compressed formats
+            file_paths: Explicit files to inspect instead of walking source_dir
+            
+        Returns:
+            True if at least `threshold` of the bytes are already compressed
+        """
+        total_bytes = 0
+        media_bytes = 0
+        
+        for path, size in self._iter_file_sizes(source_dir, file_paths):
+            total_bytes += size
+            if os.path.splitext(path)[1].lower() in self.PRECOMPRESSED_EXTENSIONS:
+                media_bytes += size
+        
+        return total_bytes > 0 and media_bytes / total_bytes >= threshold
+    
+    @staticmethod
+    def _iter_file_sizes(source_dir: str, file_paths: Optional[List[str]] = None):
+        """Yield (path, size) for the given regular files, or every file under source_dir."""
+        if file_paths is not None:
+            for file_path in file_paths:
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    yield file_path, st.st_size
+            return
+        
+        for entry in FileManager._walk_files(source_dir):
+            yield entry.path, entry.stat().st_size
+    
+    @staticmethod
+    def _walk_files(source_dir: str):
+        """
+        Yield a DirEntry for every file under source_dir.
+        
+        The entries carry the file type from the directory listing, so telling
+        files from folders needs no extra stat call.
+        """
+        pending = [source_dir]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError:
+                continue
+    
+    def export_to_zip(self, source_dir: str, zip_path: Union[str, BinaryIO, None] = None, 
+                     compression_level: int = 1, password: str = None,
+                     compression: int = zipfile.ZIP_DEFLATED,
+                     file_paths: Optional[List[str]] = None,
+                     max_workers: int = 1,
+                     progress_callback: Optional[Callable[[int, int], None]] = None) -> Union[str, BinaryIO, None]:
         """
         Export files to ZIP archive.
         
         Args:
             source_dir: Directory to zip
-            zip_path: Output ZIP file path (auto-generated if None)
-            compression_level: Compression level (0-9)
+            zip_path: Output ZIP file path (auto-generated if None), or a writable
+                binary stream such as io.BytesIO to build the archive in memory
+            compression_level: Compression level (0-9); 1 is fastest at nearly the same size
             password: Optional password protection
+            compression: ZIP compression method (ZIP_DEFLATED or ZIP_STORED)
+            file_paths: Explicit files to archive instead of walking source_dir
+            max_workers: Worker processes for DEFLATE compression (1 = in-process)
+            progress_callback: Called with (files_added, total_files) after each entry
             
         Returns:
-            Path to created ZIP file, or None if failed
+            Path to created ZIP file (or the given stream), or None if failed
         """
+        # Archive file to delete if the export does not complete
+        partial_path: Optional[Path] = None
+        
         try:
-            source_path = Path(source_dir)
+            source_path = Path(source_dir).resolve()
             if not source_path.exists():
                 self.logger.log_error(f"Source directory does not exist: {source_dir}")
                 return None
             
-            # Generate ZIP filename if not provided
-            if zip_path is None:
-                timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-                zip_path = self.base_output_dir / f"unique_photos_{timestamp}.zip"
-            else:
-                zip_path = Path(zip_path)
-            
-            zip_path.parent.mkdir(parents=True, exist_ok=True)
+            to_stream = hasattr(zip_path, 'write')
             
-            self.logger.log_info(f"Creating ZIP archive: {zip_path}")
+            if to_stream:
+                self.logger.log_info("Creating ZIP archive in memory")
+            else:
+                # Generate ZIP filename if not provided
+                if zip_path is None:
+                    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+                    zip_path = self.base_output_dir / f"unique_photos_{timestamp}.zip"
+                else:
+                    zip_path = Path(zip_path)
+                
+                zip_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                self.logger.log_info(f"Creating ZIP archive: {zip_path}")
             
             files_added = 0
             total_size = 0
             
-            with zipfile.ZipFile(
-                zip_path, 'w', 
-                compression=zipfile.ZIP_DEFLATED,
-                compresslevel=compression_level
-            ) as zipf:
+            # Add the given files, or everything under source_dir
+            entries = self._collect_entries(source_path, file_paths)
+            
+            # Buffer the archive writes too, so headers and small entries go out in large blocks
+            if to_stream:
+                output = nullcontext(zip_path)
+            else:
+                output = open(zip_path, 'wb', buffering=self.ZIP_COPY_CHUNK)
+                partial_path = zip_path
+            
+            with output as zip_file:
+                start = zip_file.tell()
                 
-                # Add password protection if requested
-                if password:
-                    zipf.setpassword(password.encode('utf-8'))
+                if not to_stream:
+                    # Reserve the worst-case archive size up front so it is laid out in few
+                    # extents; the unused tail is cut off once the archive is complete
+                    _preallocate(zip_file, sum(
+                        size + 128 + 2 * len(arcname.encode('utf-8'))
+                        for _, arcname, size in entries
+                    ))
                 
-                # Add files recursively
-                for file_path in source_path.rglob('*'):
-                    if file_path.is_file():
-                        # Calculate relative path for archive
-                        rel_path = file_path.relative_to(source_path)
-                        
-                        zipf.write(file_path, rel_path)
+                with zipfile.ZipFile(
+                    zip_file, 'w', 
+                    compression=compression,
+                    compresslevel=compression_level,
+                    allowZip64=True
+                ) as zipf:
+                    
+                    # Add password protection if requested
+                    if password:
+                        zipf.setpassword(password.encode('utf-8'))
+                    
+                    if (compression == zipfile.ZIP_DEFLATED and max_workers > 1 and len(entries) > 1
+                            and RAW_ZIP_WRITES_SUPPORTED):
+                        written = self._write_entries_parallel(zipf, entries, compression_level, max_workers)
+                    else:
+                        written = self._write_entries(zipf, entries)
+                    
+                    for file_size in written:
                         files_added += 1
-                        total_size += file_path.stat().st_size
+                        total_size += file_size
+                        
+                        if progress_callback:
+                            progress_callback(files_added, len(entries))
                         
                         if files_added % 100 == 0:
                             self.logger.log_info(f"Added {files_added} files to ZIP...")
+                
+                zip_size = zip_file.tell() - start
+                
+                if not to_stream:
+                    zip_file.truncate()
+                    
+                    # Written archive pages are not needed again by this process
+                    zip_file.flush()
+                    _fadvise(zip_file, 'POSIX_FADV_DONTNEED')
             
-            zip_size = zip_path.stat().st_size
+            partial_path = None
             compression_ratio = (1 - zip_size / total_size) * 100 if total_size > 0 else 0
             
             self.logger.log_info(
@@ -413,11 +637,271 @@ class FileManager:
                 f"({compression_ratio:.1f}% compression)"
             )
             
-            return str(zip_path)
+            return zip_path if to_stream else str(zip_path)
             
         except Exception as e:
             self.logger.log_error(f"ZIP export failed: {str(e)}")
             return None
+        
+        finally:
+            # A preallocated partial archive looks complete by size, so never leave one behind
+            if partial_path is not None:
+                partial_path.unlink(missing_ok=True)
+    
+    @staticmethod
+    def available_archive_formats() -> List[str]:
+        """
+        List the archive formats that can be written on this system.
+        
+        Returns:
+            'zip' always, plus 'tar.gz' when pigz is on PATH and '7z' when py7zr is installed
+        """
+        formats = ['zip']
+        if shutil.which('pigz') and shutil.which('tar'):
+            formats.append('tar.gz')
+        if PY7ZR_AVAILABLE:
+            formats.append('7z')
+        return formats
+    
+    def export_to_tar_gz(self, source_dir: str, archive_path: str,
+                         compression_level: int = 1,
+                         file_paths: Optional[List[str]] = None,
+                         env: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """
+        Export files to a gzip-compressed tar archive, compressed in parallel by pigz.
+        
+        Args:
+            source_dir: Directory to archive
+            archive_path: Output archive path
+            compression_level: pigz compression level (0-9)
+            file_paths: Explicit files to archive instead of walking source_dir
+            env: Environment for tar and pigz (defaults to this process's environment)
+            
+        Returns:
+            Path to created archive, or None if failed
+        """
+        # Archive file to delete if the export does not complete
+        partial_path: Optional[Path] = None
+        
+        try:
+            source_path = Path(source_dir).resolve()
+            if not source_path.exists():
+                self.logger.log_error(f"Source directory does not exist: {source_dir}")
+                return None
+            
+            archive_path = Path(archive_path)
+            archive_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            entries = self._collect_entries(source_path, file_paths)
+            self.logger.log_info(f"Creating tar.gz archive with pigz: {archive_path}")
+            
+            # Stage a symlink per entry under its archive name so tar stores the same
+            # names as the zip and 7z exports; -h archives the files the links point to
+            with tempfile.TemporaryDirectory(prefix='picture_finder_tar_') as staging_dir:
+                names = bytearray()
+                for file_path, arcname, _ in entries:
+                    link_path = os.path.join(staging_dir, arcname)
+                    os.makedirs(os.path.dirname(link_path), exist_ok=True)
+                    os.symlink(file_path, link_path)
+                    names += os.fsencode(arcname) + b'\0'
+                
+                # Names are fed to tar NUL-separated on stdin
+                partial_path = archive_path
+                result = subprocess.run(
+                    ['tar', '-c', '-h', '-f', str(archive_path),
+                     f'--use-compress-program=pigz -{compression_level}',
+                     '-C', staging_dir, '--null', '-T', '-'],
+                    input=bytes(names),
+                    capture_output=True,
+                    env=env
+                )
+            
+            if result.returncode != 0:
+                self.logger.log_error(
+                    f"tar.gz export failed: {result.stderr.decode(errors='replace').strip()}"
+                )
+                return None
+            
+            partial_path = None
+            self.logger.log_info(f"tar.gz export completed: {len(entries)} files")
+            return str(archive_path)
+            
+        except Exception as e:
+            self.logger.log_error(f"tar.gz export failed: {str(e)}")
+            return None
+        
+        finally:
+            if partial_path is not None:
+                partial_path.unlink(missing_ok=True)
+    
+    def export_to_7z(self, source_dir: str, archive_path: str,
+                     file_paths: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Export files to a 7z archive using py7zr.
+        
+        Args:
+            source_dir: Directory to archive
+            archive_path: Output archive path
+            file_paths: Explicit files to archive instead of walking source_dir
+            
+        Returns:
+            Path to created archive, or None if failed
+        """
+        if not PY7ZR_AVAILABLE:
+            self.logger.log_error("7z export requires py7zr")
+            return None
+        
+        # Archive file to delete if the export does not complete
+        partial_path: Optional[Path] = None
+        
+        try:
+            source_path = Path(source_dir).resolve()
+            if not source_path.exists():
+                self.logger.log_error(f"Source directory does not exist: {source_dir}")
+                return None
+            
+            archive_path = Path(archive_path)
+            archive_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            entries = self._collect_entries(source_path, file_paths)
+            self.logger.log_info(f"Creating 7z archive: {archive_path}")
+            
+            partial_path = archive_path
+            with py7zr.SevenZipFile(archive_path, 'w', mp=True) as archive:
+                for file_path, arcname, _ in entries:
+                    archive.write(file_path, arcname)
+            
+            partial_path = None
+            self.logger.log_info(f"7z export completed: {len(entries)} files")
+            return str(archive_path)
+            
+        except Exception as e:
+            self.logger.log_error(f"7z export failed: {str(e)}")
+            return None
+        
+        finally:
+            if partial_path is not None:
+                partial_path.unlink(missing_ok=True)
+    
+    def _collect_entries(self, source_path: Path,
+                         file_paths: Optional[List[str]] = None) -> List[Tuple[Path, str, int]]:
+        """
+        Resolve the files to archive as (path, archive name, size) triples.
+        
+        Files under source_path keep their relative path. Files outside it are
+        stored under their own name, numbered when that name is already taken,
+        so every archive name is unique.
+        """
+        if file_paths is not None:
+            file_paths = [str(Path(p).resolve()) for p in file_paths]
+        
+        entries = []
+        outside = []
+        used_names = set()
+        for path, size in self._iter_file_sizes(str(source_path), file_paths):
+            file_path = Path(path)
+            
+            # Calculate relative path for archive
+            if file_path.is_relative_to(source_path):
+                arcname = str(file_path.relative_to(source_path))
+                if arcname not in used_names:  # Same file listed twice
+                    used_names.add(arcname)
+                    entries.append((file_path, arcname, size))
+            else:
+                outside.append((file_path, size))
+        
+        for file_path, size in outside:
+            arcname = self._unique_arcname(file_path.name, used_names)
+            if arcname != file_path.name:
+                self.logger.log_info(
+                    f"Archive name {file_path.name} already used; storing {file_path} as {arcname}"
+                )
+            used_names.add(arcname)
+            entries.append((file_path, arcname, size))
+        
+        return entries
+    
+    @staticmethod
+    def _unique_arcname(name: str, used_names: Set[str]) -> str:
+        """Number an archive name the way _get_unique_target_path numbers files."""
+        stem, extension = os.path.splitext(name)
+        counter = 1
+        
+        while name in used_names:
+            name = f"{stem}_{counter}{extension}"
+            counter += 1
+        
+        return name
+    
+    def _write_entries(self, zipf: zipfile.ZipFile, entries: List[Tuple[Path, str, int]]):
+        """Write entries with the archive's own compressor, yielding each file size."""
+        for file_path, arcname, _ in entries:
+            zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+            zinfo.compress_type = zipf.compression
+            _set_compress_level(zinfo, zipf.compresslevel)
+            
+            # Stream in large chunks rather than going through ZipFile.write
+            with open(file_path, 'rb', buffering=self.ZIP_COPY_CHUNK) as src, \
+                    zipf.open(zinfo, 'w') as dest:
+                # Read ahead aggressively and drop the pages once copied, so
+                # exporting does not push everything else out of the page cache
+                _fadvise(src, 'POSIX_FADV_SEQUENTIAL')
+                shutil.copyfileobj(src, dest, self.ZIP_COPY_CHUNK)
+                _fadvise(src, 'POSIX_FADV_DONTNEED')
+            
+            yield zinfo.file_size
+    
+    def _write_entries_parallel(self, zipf: zipfile.ZipFile, entries: List[Tuple[Path, str, int]],
+                                compression_level: int, max_workers: int):
+        """
+        Compress entries in worker processes and append them in order, yielding each file size.
+        
+        Only a bounded window of files is in flight, and files above
+        PARALLEL_DEFLATE_MAX_SIZE are streamed by _write_entries instead, so memory
+        use stays proportional to the worker count rather than the file sizes.
+        Requires RAW_ZIP_WRITES_SUPPORTED, since entries are appended via ZipFile
+        internals.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for file_path, arcname, size in entries:
+                if size > self.PARALLEL_DEFLATE_MAX_SIZE:
+                    # Keep entries in order: finish the queued ones before streaming
+                    while pending:
+                        yield self._write_precompressed(zipf, *pending.popleft())
+                    yield from self._write_entries(zipf, [(file_path, arcname, size)])
+                    continue
+                
+                future = executor.submit(_deflate_file, str(file_path), compression_level)
+                pending.append((file_path, arcname, future))
+                
+                if len(pending) >= max_workers * 2:
+                    yield self._write_precompressed(zipf, *pending.popleft())
+            
+            while pending:
+                yield self._write_precompressed(zipf, *pending.popleft())
+    
+    def _write_precompressed(self, zipf: zipfile.ZipFile, file_path: Path, arcname: str, future) -> int:
+        """Append an already DEFLATE-compressed entry to the archive."""
+        data, crc, file_size = future.result()
+        
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = len(data)
+        zip64 = max(file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+        
+        # Same bookkeeping ZipFile.write does when it streams an entry itself
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        zipf.fp.write(data)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf._didModify = True
+        
+        return file_size
     
     def get_file_list(self, folder_path: str, extensions: Set[str] = None) -> List[Path]:
         """
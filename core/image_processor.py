@@ -8,8 +8,8 @@ import time
 import hashlib
 import asyncio
 from collections import defaultdict
-from multiprocessing import Pool, Manager, cpu_count
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from multiprocessing import cpu_count
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from threading import Lock
 import threading
 from PIL import Image, ImageFile
@@ -99,6 +99,8 @@ class ImageHasher:
         """
         Calculate hash for a single image file with enhanced error handling and caching.
         
+        Uncached files are hashed through hash_batch with this hasher's algorithm.
+        
         Args:
             file_path: Path to the image file
             max_size: Maximum image size for processing (width, height)
@@ -106,78 +108,123 @@ class ImageHasher:
         Returns:
             Tuple of (hash_string, file_path, metadata)
         """
+        start_time = time.time()
+        
+        # Check cache first (based on file path, size, and modification time)
+        cache_key = None
+        try:
+            file_stat = os.stat(file_path)
+            cache_key = f"{file_path}:{file_stat.st_size}:{file_stat.st_mtime}:{self.algorithm}"
+        except OSError:
+            pass  # hash_batch reports the error
+        
+        if cache_key in self.hash_cache:
+            metadata = {
+                'file_size': file_stat.st_size,
+                'image_size': (0, 0),
+                'format': None,
+                'error': None,
+                'processing_time': time.time() - start_time,
+                'from_cache': True
+            }
+            return self.hash_cache[cache_key], file_path, metadata
+        
+        hashes, metadata = self.hash_batch(file_path, [self.algorithm], max_size)
+        metadata['from_cache'] = False
+        
+        hash_string = hashes.get(self.algorithm)
+        if hash_string is not None and cache_key is not None:
+            self.hash_cache[cache_key] = hash_string
+        
+        return hash_string, file_path, metadata
+    
+    def hash_batch(self, file_path: str, algorithms: List[str],
+                   max_size: Tuple[int, int] = (1024, 1024)) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """
+        Calculate several hashes of one image, decoding it only once.
+        
+        The image is decoded and reduced to grayscale once; the hash functions
+        then run on that shared image in a thread pool.
+        
+        Args:
+            file_path: Path to the image file
+            algorithms: Hash algorithm names (see HASH_ALGORITHMS)
+            max_size: Maximum image size for processing (width, height)
+            
+        Returns:
+            Tuple of ({algorithm: hash_string}, metadata); the dict is empty on error
+        """
         metadata = {
             'file_size': 0,
             'image_size': (0, 0),
             'format': None,
             'error': None,
-            'processing_time': 0,
-            'from_cache': False
+            'processing_time': 0
         }
         
         start_time = time.time()
+        hashes = {}
         
         try:
             # Check if file exists and is readable
             path_obj = Path(file_path)
             if not path_obj.exists():
                 metadata['error'] = 'File does not exist'
-                return None, file_path, metadata
+                return hashes, metadata
             
             metadata['file_size'] = path_obj.stat().st_size
             
-            # Check cache first (based on file path, size, and modification time)
-            file_stat = path_obj.stat()
-            cache_key = f"{file_path}:{file_stat.st_size}:{file_stat.st_mtime}:{self.algorithm}"
-            
-            if cache_key in self.hash_cache:
-                metadata['from_cache'] = True
-                metadata['processing_time'] = time.time() - start_time
-                return self.hash_cache[cache_key], file_path, metadata
-            
             # Skip very large files that might cause memory issues
             if metadata['file_size'] > 100 * 1024 * 1024:  # 100MB
                 metadata['error'] = 'File too large (>100MB)'
-                return None, file_path, metadata
+                return hashes, metadata
             
-            # Open and process image
             with Image.open(file_path) as img:
                 metadata['format'] = img.format
                 metadata['image_size'] = img.size
+                luma = self._prepare_image(img, max_size).convert('L')
+            
+            functions = {
+                algorithm: self.HASH_ALGORITHMS.get(algorithm, imagehash.average_hash)
+                for algorithm in algorithms
+            }
+            with ThreadPoolExecutor(max_workers=max(1, len(functions))) as executor:
+                futures = {
+                    algorithm: executor.submit(function, luma, hash_size=self.hash_size)
+                    for algorithm, function in functions.items()
+                }
+                hashes = {algorithm: str(future.result()) for algorithm, future in futures.items()}
                 
-                # Convert to RGB if needed
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    img = img.convert('RGB')
-                elif img.mode not in ('RGB', 'L'):
-                    img = img.convert('RGB')
-                
-                # Resize if image is too large
-                if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
-                    img.thumbnail(max_size, Image.Resampling.LANCZOS)
-                
-                # Calculate hash
-                hash_obj = self.hash_function(img, hash_size=self.hash_size)
-                hash_string = str(hash_obj)
-                
-                # Store in cache
-                self.hash_cache[cache_key] = hash_string
-                
-                metadata['processing_time'] = time.time() - start_time
-                return hash_string, file_path, metadata
-                
-        except FileNotFoundError:
-            metadata['error'] = 'File not found'
-        except PermissionError:
-            metadata['error'] = 'Permission denied'
-        except Image.UnidentifiedImageError:
-            metadata['error'] = 'Not a valid image file'
-        except OSError as e:
-            metadata['error'] = f'OS error: {str(e)}'
         except Exception as e:
-            metadata['error'] = f'Unexpected error: {str(e)}'
+            metadata['error'] = self._error_message(e)
         
         metadata['processing_time'] = time.time() - start_time
-        return None, file_path, metadata
+        return hashes, metadata
+    
+    @staticmethod
+    def _prepare_image(img: Image.Image, max_size: Tuple[int, int]) -> Image.Image:
+        """Convert an opened image to RGB or L and shrink it to fit max_size."""
+        if img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        
+        # Resize if image is too large
+        if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
+            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+        
+        return img
+    
+    @staticmethod
+    def _error_message(error: Exception) -> str:
+        """Describe a hashing failure for the metadata 'error' field."""
+        if isinstance(error, FileNotFoundError):
+            return 'File not found'
+        if isinstance(error, PermissionError):
+            return 'Permission denied'
+        if isinstance(error, Image.UnidentifiedImageError):
+            return 'Not a valid image file'
+        if isinstance(error, OSError):
+            return f'OS error: {str(error)}'
+        return f'Unexpected error: {str(error)}'
     
     def clear_cache(self):
         """Clear the hash cache to free memory."""
@@ -192,6 +239,29 @@ class ImageHasher:
         }
 
 
+# Hasher owned by a pool worker process, reused across the chunks it receives
+_worker_hasher: Optional[ImageHasher] = None
+
+
+def _hash_chunk(file_paths: List[str], algorithm: str) -> List[Tuple[Optional[str], str, Dict[str, Any]]]:
+    """
+    Hash a chunk of image files.
+    
+    Runs in a worker process, so it must stay a module-level function.
+    
+    Args:
+        file_paths: Image file paths to hash
+        algorithm: Hash algorithm name
+        
+    Returns:
+        List of (hash_string, file_path, metadata) tuples
+    """
+    global _worker_hasher
+    if _worker_hasher is None or _worker_hasher.algorithm != algorithm:
+        _worker_hasher = ImageHasher(algorithm)
+    return [_worker_hasher.hash_file(path) for path in file_paths]
+
+
 class DuplicateDetector:
     """Enhanced duplicate detection with configurable similarity and performance optimization."""
     
@@ -224,9 +294,18 @@ class DuplicateDetector:
         # Progress tracking
         self.progress_callback: Optional[Callable] = None
         self.cancel_flag = threading.Event()
+        
+        # Worker pool shared by all batches of one find_duplicates() run
+        self._executor: Optional[ProcessPoolExecutor] = None
     
     def set_progress_callback(self, callback: Callable[[int, int, str], None]):
-        """Set callback for progress updates (current, total, message)."""
+        """
+        Set callback for progress updates (current, total, message).
+        
+        The callback is invoked once per group of files rather than per file:
+        every max(1, chunk_size // 16) files when hashing sequentially, and once
+        per completed worker chunk when hashing in the process pool.
+        """
         self.progress_callback = callback
     
     def cancel_processing(self):
@@ -284,6 +363,9 @@ class DuplicateDetector:
         if memory.percent > 80:
             chunk_size = min(chunk_size, 50)
         
+        # Files hashed between progress reports on the sequential path
+        report_every = max(1, chunk_size // 16)
+        
         # Process files in batches
         duplicates_map = defaultdict(list)
         processing_stats = {
@@ -307,67 +389,76 @@ class DuplicateDetector:
         self.logger.log_info(f"Processing {len(file_batches)} batches with {self.settings['processes']} processes")
         
         # Process batches
-        for batch_idx, batch_files in enumerate(file_batches):
-            if self.cancel_flag.is_set():
-                self.logger.log_info("Processing cancelled by user")
-                break
-            
-            batch_start_time = time.time()
-            
-            # Update performance monitor
-            self.performance_monitor.update_stats()
-            
-            # Check if we should throttle
-            if self.performance_monitor.should_throttle():
-                self.logger.log_info("High system usage detected, throttling...")
-                time.sleep(0.5)
-            
-            # Progress update
-            if self.progress_callback:
-                eta_seconds = None
-                if batch_idx > 0:
-                    elapsed = time.time() - start_time
-                    rate = processing_stats['processed_files'] / elapsed
-                    remaining_files = total_files - processing_stats['processed_files']
-                    eta_seconds = remaining_files / rate if rate > 0 else None
+        try:
+            for batch_idx, batch_files in enumerate(file_batches):
+                if self.cancel_flag.is_set():
+                    self.logger.log_info("Processing cancelled by user")
+                    break
                 
-                self.progress_callback(
-                    processing_stats['processed_files'],
-                    total_files,
-                    f"Processing batch {batch_idx + 1}/{len(file_batches)}"
-                )
+                batch_start_time = time.time()
                 
-                self.logger.log_batch_progress(
-                    batch_idx + 1, len(file_batches),
-                    processing_stats['processed_files'], total_files,
-                    eta_seconds
-                )
-            
-            # Process batch
-            batch_results = self._process_batch(batch_files)
-            
-            # Group results
-            for hash_str, file_path, metadata in batch_results:
-                processing_stats['processed_files'] += 1
+                # Update performance monitor
+                self.performance_monitor.update_stats()
                 
-                if metadata.get('error'):
-                    processing_stats['errors'] += 1
-                    self.logger.log_error(f"Error processing {file_path}: {metadata['error']}")
-                elif hash_str:
-                    duplicates_map[hash_str].append(file_path)
-            
-            # Memory management
-            if batch_idx % 10 == 0:
-                gc.collect()
-                memory_info = psutil.Process().memory_info()
-                processing_stats['memory_usage_mb'] = memory_info.rss / (1024 * 1024)
-            
-            batch_time = time.time() - batch_start_time
-            self.logger.log_performance(f"batch_{batch_idx + 1}", batch_time, files=len(batch_files))
-            
-            # Adaptive sleep based on performance mode
-            if self.performance_mode == 'low':
-                time.sleep(0.01)
+                # Check if we should throttle
+                if self.performance_monitor.should_throttle():
+                    self.logger.log_info("High system usage detected, throttling...")
+                    time.sleep(0.5)
+                
+                # Progress update
+                if self.progress_callback:
+                    eta_seconds = None
+                    if batch_idx > 0:
+                        elapsed = time.time() - start_time
+                        rate = processing_stats['processed_files'] / elapsed
+                        remaining_files = total_files - processing_stats['processed_files']
+                        eta_seconds = remaining_files / rate if rate > 0 else None
+                
+                    self.progress_callback(
+                        processing_stats['processed_files'],
+                        total_files,
+                        f"Processing batch {batch_idx + 1}/{len(file_batches)}"
+                    )
+                
+                    self.logger.log_batch_progress(
+                        batch_idx + 1, len(file_batches),
+                        processing_stats['processed_files'], total_files,
+                        eta_seconds
+                    )
+                
+                # Process batch, reporting progress as each chunk of it completes
+                report = None
+                if self.progress_callback:
+                    def report(done, base=processing_stats['processed_files'],
+                               message=f"Processing batch {batch_idx + 1}/{len(file_batches)}"):
+                        self.progress_callback(base + done, total_files, message)
+                
+                batch_results = self._process_batch(batch_files, report, report_every)
+                
+                # Group results
+                for hash_str, file_path, metadata in batch_results:
+                    processing_stats['processed_files'] += 1
+                
+                    if metadata.get('error'):
+                        processing_stats['errors'] += 1
+                        self.logger.log_error(f"Error processing {file_path}: {metadata['error']}")
+                    elif hash_str:
+                        duplicates_map[hash_str].append(file_path)
+                
+                # Memory management
+                if batch_idx % 10 == 0:
+                    gc.collect()
+                    memory_info = psutil.Process().memory_info()
+                    processing_stats['memory_usage_mb'] = memory_info.rss / (1024 * 1024)
+                
+                batch_time = time.time() - batch_start_time
+                self.logger.log_performance(f"batch_{batch_idx + 1}", batch_time, files=len(batch_files))
+                
+                # Adaptive sleep based on performance mode
+                if self.performance_mode == 'low':
+                    time.sleep(0.01)
+        finally:
+            self._shutdown_executor()
         
         # Filter actual duplicates (groups with more than 1 file)
         duplicate_groups = {
@@ -392,44 +483,82 @@ class DuplicateDetector:
         
         return duplicate_groups, processing_stats
     
-    def _process_batch(self, file_paths: List[Path]) -> List[Tuple[Optional[str], str, Dict[str, Any]]]:
+    def _process_batch(self, file_paths: List[Path],
+                       report: Optional[Callable[[int], None]] = None,
+                       report_every: int = 1) -> List[Tuple[Optional[str], str, Dict[str, Any]]]:
         """Process a batch of files with multiprocessing or threading."""
         if self.settings['processes'] > 1 and len(file_paths) > 10:
-            return self._process_batch_multiprocessing(file_paths)
+            return self._process_batch_multiprocessing(file_paths, report, report_every)
         else:
-            return self._process_batch_sequential(file_paths)
+            return self._process_batch_sequential(file_paths, report, report_every)
     
-    def _process_batch_sequential(self, file_paths: List[Path]) -> List[Tuple[Optional[str], str, Dict[str, Any]]]:
-        """Process batch sequentially."""
+    def _process_batch_sequential(self, file_paths: List[Path],
+                                  report: Optional[Callable[[int], None]] = None,
+                                  report_every: int = 1) -> List[Tuple[Optional[str], str, Dict[str, Any]]]:
+        """Process batch sequentially, reporting progress every report_every files."""
         results = []
         for file_path in file_paths:
             if self.cancel_flag.is_set():
                 break
             result = self.hasher.hash_file(str(file_path))
             results.append(result)
+            if report and len(results) % report_every == 0:
+                report(len(results))
         return results
     
-    def _process_batch_multiprocessing(self, file_paths: List[Path]) -> List[Tuple[Optional[str], str, Dict[str, Any]]]:
-        """Process batch using multiprocessing."""
+    def _process_batch_multiprocessing(self, file_paths: List[Path],
+                                       report: Optional[Callable[[int], None]] = None,
+                                       report_every: int = 1) -> List[Tuple[Optional[str], str, Dict[str, Any]]]:
+        """
+        Process batch in the shared worker pool.
+        
+        The batch is split into a few chunks per worker; each worker keeps its own
+        hasher, so only file paths and results cross the process boundary.
+        Progress is reported per chunk; report_every applies if the batch falls
+        back to sequential processing.
+        """
         try:
-            with Pool(processes=self.settings['processes']) as pool:
-                # Convert paths to strings for pickling
-                str_paths = [str(p) for p in file_paths]
-                
-                # Create multiple hasher instances for each process
-                hashers = [ImageHasher(self.hash_algorithm) for _ in range(len(str_paths))]
-                
-                # Map work to processes
-                results = pool.starmap(
-                    ImageHasher.hash_file, 
-                    [(hasher, path) for hasher, path in zip(hashers, str_paths)]
-                )
-                
-                return results
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.settings['processes'])
+            
+            str_paths = [str(p) for p in file_paths]
+            step = max(1, -(-len(str_paths) // (self.settings['processes'] * 4)))
+            futures = {
+                self._executor.submit(_hash_chunk, str_paths[i:i + step], self.hash_algorithm): i
+                for i in range(0, len(str_paths), step)
+            }
+            
+            # Progress follows completion, but results are returned in input order
+            # so duplicate groups list their files deterministically
+            chunk_results = {}
+            completed = 0
+            for future in as_completed(futures):
+                chunk_results[futures[future]] = future.result()
+                completed += len(chunk_results[futures[future]])
+                if report:
+                    report(completed)
                 
+                if self.cancel_flag.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+            
+            return [result for start in sorted(chunk_results) for result in chunk_results[start]]
+            
         except Exception as e:
             self.logger.log_error(f"Multiprocessing failed, falling back to sequential: {str(e)}")
-            return self._process_batch_sequential(file_paths)
+            
+            # A broken pool rejects all further work, so let the next batch start a new one
+            if isinstance(e, BrokenExecutor):
+                self._shutdown_executor()
+            
+            return self._process_batch_sequential(file_paths, report, report_every)
+    
+    def _shutdown_executor(self):
+        """Stop the worker pool used by the last run."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
     
     def _apply_similarity_threshold(self, duplicate_groups: Dict[str, List[str]]) -> Dict[str, List[str]]:
         """Apply similarity threshold to merge near-duplicate groups."""
@@ -510,20 +639,23 @@ class AdvancedPerformanceMonitor:
             'phase_times': {}
         }
         self.phase_start_times = {}
+        
+        # Time source for all measurements; replaceable for deterministic timing
+        self._clock: Callable[[], float] = time.time
     
     def start_monitoring(self):
         """Start performance monitoring."""
-        self.metrics['start_time'] = time.time()
+        self.metrics['start_time'] = self._clock()
         self._log_system_info()
     
     def start_phase(self, phase_name: str):
         """Start timing a processing phase."""
-        self.phase_start_times[phase_name] = time.time()
+        self.phase_start_times[phase_name] = self._clock()
     
     def end_phase(self, phase_name: str):
         """End timing a processing phase."""
         if phase_name in self.phase_start_times:
-            duration = time.time() - self.phase_start_times[phase_name]
+            duration = self._clock() - self.phase_start_times[phase_name]
             self.metrics['phase_times'][phase_name] = duration
     
     def record_cache_hit(self):
@@ -544,7 +676,7 @@ class AdvancedPerformanceMonitor:
     
     def end_monitoring(self):
         """End performance monitoring and calculate final metrics."""
-        self.metrics['end_time'] = time.time()
+        self.metrics['end_time'] = self._clock()
         
         if self.metrics['start_time']:
             total_time = self.metrics['end_time'] - self.metrics['start_time']
@@ -698,6 +830,7 @@ class ImageProcessor:
             'duplicate_groups': len(duplicate_groups),
             'total_duplicates': sum(len(group) for group in duplicate_groups.values()),
             'unique_files_processed': len(processed_unique),
+            'unique_paths': processed_unique,
             'zip_export_path': zip_path,
             'file_manager_stats': self.file_manager.get_statistics()
         }
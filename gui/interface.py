@@ -7,66 +7,212 @@ import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 import threading
 import asyncio
+import queue
 import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any
-import webbrowser
+from typing import Optional, Callable, Dict, Any, List, TYPE_CHECKING
 
-from gui.styles import PictureFinderTheme, add_tooltip, create_icon_button, ICONS, make_accessible
-from core.image_processor import ImageProcessor
+from gui.styles import (PictureFinderTheme, add_tooltip, create_icon_button, create_radio_group,
+                        ICONS, make_accessible)
 from core.log_writer import get_logger, create_log_file
 
+if TYPE_CHECKING:
+    # Pulls in PIL/imagehash/numpy; imported on first run instead of at startup
+    from core.image_processor import ImageProcessor
+
+
+# Command used to open files with the default application (Windows uses os.startfile)
+_OPEN_CMD = 'open' if sys.platform == 'darwin' else 'xdg-open'
+
+# Notebook tab labels
+_MAIN_TAB_LABEL = ' '.join((ICONS['image'], "Main"))
+_SETTINGS_TAB_LABEL = ' '.join((ICONS['settings'], "Settings"))
+
+# Message templates, filled in with str.format_map
+CONFIRM_TEMPLATE = (
+    "Start processing photos in:\n{folder}\n\n"
+    "Action: {action} unique photos\n"
+    "Performance: {performance}\n"
+    "Recursive: {recursive}\n\n"
+    "Continue?"
+)
+
+STATS_TEMPLATE = (
+    "Processing completed in {processing_time:.1f} seconds\n"
+    "Files scanned: {total_files:,}\n"
+    "Duplicate groups: {duplicate_groups:,}\n"
+    "Total duplicates: {total_duplicates:,}\n"
+    "Unique files processed: {unique_files_processed:,}\n"
+    "Videos separated: {videos_separated:,}"
+)
+
+COMPLETION_TEMPLATE = (
+    "Processing completed successfully!\n\n"
+    "• {total_duplicates:,} duplicates found\n"
+    "• {unique_files_processed:,} unique photos processed\n"
+    "• {videos_separated:,} videos separated\n\n"
+    "Check the output folders for results."
+)
+
+# Save-dialog label and extension for each export archive format
+ARCHIVE_FILETYPES = {
+    'zip': ("ZIP files", ".zip"),
+    'tar.gz': ("tar.gz archives", ".tar.gz"),
+    '7z': ("7z archives", ".7z"),
+}
+
+HELP_TEXT = """\
+Picture Finder - Help
+
+1. SELECT FOLDER: Choose the folder containing your photos
+
+2. CHOOSE ACTION:
+   • Copy: Keep original files, copy unique photos to 'unique_photos' folder
+   • Move: Move unique photos to 'unique_photos' folder (originals are removed)
+
+3. PERFORMANCE MODE:
+   • Low: Uses 1 CPU core and minimal RAM (slower, but system-friendly)
+   • Medium: Uses 2 CPU cores and moderate RAM (balanced)
+   • High: Uses 4 CPU cores and high RAM (fastest, but resource-intensive)
+
+4. SETTINGS TAB:
+   • Similarity Threshold: How similar images must be (1=strict, 20=lenient)
+   • Batch Size: Number of files processed at once
+   • Hash Algorithm: Method for detecting duplicates
+   • Recursive Scan: Include subfolders
+
+5. OUTPUT:
+   • Duplicates are moved to 'duplicates' folder
+   • Unique photos go to 'unique_photos' folder
+   • Videos are moved to 'videos' folder
+   • Detailed logs are created for each run
+
+Tips:
+• Start with default settings for most use cases
+• Use lower similarity threshold for stricter duplicate detection
+• Enable recursive scan to process subfolders
+• Check logs for detailed processing information
+"""
+
+ACCESSIBILITY_HELP_TEXT = """\
+Accessibility Keyboard Shortcuts:
+
+File Operations:
+• Ctrl+O: Browse for folder
+• Ctrl+S: Save settings
+• Ctrl+E: Export results to ZIP
+
+Processing:
+• F5: Start processing
+• Escape: Cancel processing
+
+Navigation:
+• F1: Show help
+• Ctrl+H: Show this accessibility help
+• Ctrl+L: View logs
+• Ctrl+Tab: Next tab
+• Ctrl+Shift+Tab: Previous tab
+
+Accessibility:
+• Ctrl+Alt+H: Toggle high contrast mode
+• Ctrl+Alt+T: Toggle enhanced tooltips
+
+Quick Actions:
+• Ctrl+R: Refresh folder
+• Ctrl+Q: Quit application
+
+All buttons and controls are keyboard accessible using Tab/Shift+Tab navigation."""
+
 
 class ProgressDialog:
     """Modal progress dialog with cancel functionality."""
     
-    def __init__(self, parent, title: str = "Processing..."):
+    # Minimum time between progress redraws
+    PROGRESS_INTERVAL_MS = 50
+    
+    # Canvas geometry for the progress bar and status text
+    CANVAS_WIDTH = 360
+    CANVAS_HEIGHT = 60
+    BAR_HEIGHT = 20
+    
+    # Dialog reused across runs, see show()
+    _instance: Optional['ProgressDialog'] = None
+    
+    def __init__(self, parent, theme: PictureFinderTheme, title: str = "Processing..."):
         """
         Initialize progress dialog.
         
         Args:
             parent: Parent window
+            theme: Theme whose active palette colors the progress bar
             title: Dialog title
         """
         self.parent = parent
+        self.theme = theme
         self.dialog = tk.Toplevel(parent)
-        self.dialog.title(title)
         self.dialog.geometry("400x150")
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
-        self.dialog.grab_set()
         
-        # Center the dialog
-        self.dialog.geometry("+%d+%d" % (
-            parent.winfo_rootx() + 50,
-            parent.winfo_rooty() + 50
-        ))
-        
-        self.cancelled = False
         self.cancel_callback: Optional[Callable] = None
         
+        # Latest progress values, drawn at most once per PROGRESS_INTERVAL_MS
+        self._pending: Optional[tuple] = None
+        self._flush_id: Optional[str] = None
+        self._last_draw = 0.0
+        
         self._create_widgets()
+        self._open(title)
+    
+    @classmethod
+    def show(cls, parent, theme: PictureFinderTheme, title: str = "Processing...") -> 'ProgressDialog':
+        """
+        Show the progress dialog, reusing the hidden one from a previous run.
+        
+        Args:
+            parent: Parent window
+            theme: Theme whose active palette colors the progress bar
+            title: Dialog title
+            
+        Returns:
+            The visible progress dialog
+        """
+        dialog = cls._instance
+        if (dialog is not None and dialog.parent is parent and dialog.theme is theme
+                and dialog.dialog.winfo_exists()):
+            dialog._open(title)
+        else:
+            dialog = cls(parent, theme, title)
+            cls._instance = dialog
+        return dialog
     
     def _create_widgets(self):
         """Create dialog widgets."""
-        # Progress bar
-        self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(
+        # Progress bar and status text share one canvas; updates only move
+        # the fill rectangle and replace the text item
+        self.canvas = tk.Canvas(
             self.dialog,
-            variable=self.progress_var,
-            maximum=100,
-            length=350
+            width=self.CANVAS_WIDTH,
+            height=self.CANVAS_HEIGHT,
+            highlightthickness=0
         )
-        self.progress_bar.pack(pady=20, padx=20)
+        self.canvas.pack(pady=(20, 10), padx=20)
         
-        # Status label
-        self.status_var = tk.StringVar(value="Initializing...")
-        self.status_label = ttk.Label(
-            self.dialog,
-            textvariable=self.status_var,
-            font=('Helvetica', 10)
+        # Colored from the theme in _apply_colors
+        self.canvas.create_rectangle(
+            0, 0, self.CANVAS_WIDTH, self.BAR_HEIGHT, tags='trough'
+        )
+        self.canvas.create_rectangle(
+            0, 0, 0, self.BAR_HEIGHT, outline='', tags='fill'
+        )
+        self.canvas.create_text(
+            self.CANVAS_WIDTH / 2, self.BAR_HEIGHT + 20,
+            font=('Helvetica', 10), tags='status'
         )
-        self.status_label.pack(pady=(0, 10))
         
         # Cancel button
         self.cancel_button = ttk.Button(
@@ -75,42 +221,143 @@ class ProgressDialog:
             command=self._on_cancel
         )
         self.cancel_button.pack(pady=(0, 20))
+        
+        # Inline confirmation shown in place of the cancel button; avoids a
+        # modal messagebox and its nested event loop while progress arrives
+        self.confirm_frame = ttk.Frame(self.dialog)
+        ttk.Label(self.confirm_frame, text="Cancel processing?").pack(side='left', padx=(0, 10))
+        ttk.Button(
+            self.confirm_frame,
+            text="Yes",
+            command=self._confirm_cancel
+        ).pack(side='left', padx=(0, 5))
+        ttk.Button(
+            self.confirm_frame,
+            text="No",
+            command=self._dismiss_confirm
+        ).pack(side='left')
+    
+    def _open(self, title: str):
+        """Reset the dialog state and display it modally."""
+        self.cancelled = False
+        self.cancel_callback = None
+        self._pending = None
+        self._last_draw = 0.0
+        self._dismiss_confirm()
+        self._apply_colors()
+        self._draw(0.0, "Initializing...")
+        
+        self.dialog.title(title)
+        
+        # Center the dialog
+        self.dialog.geometry("+%d+%d" % (
+            self.parent.winfo_rootx() + 50,
+            self.parent.winfo_rooty() + 50
+        ))
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+    
+    def _apply_colors(self):
+        """Color the bar from the theme's active palette, which may have changed since the last run."""
+        colors = self.theme.COLORS
+        self.canvas.itemconfigure('trough', fill=colors['secondary_bg'], outline=colors['border'])
+        self.canvas.itemconfigure('fill', fill=colors['primary_accent'])
     
     def update_progress(self, current: int, total: int, message: str = ""):
-        """Update progress display."""
+        """
+        Record the latest progress and schedule a redraw.
+        
+        Tk thread only: this schedules Tk callbacks and draws on the canvas.
+        Workers post progress through MainTab._update_progress, which the Tk
+        thread passes on here from _drain_progress.
+        """
         if self.cancelled:
             return
-            
+        
+        self._pending = (current, total, message)
+        if self._flush_id is None:
+            elapsed_ms = (time.monotonic() - self._last_draw) * 1000
+            self._flush_id = self.dialog.after(
+                max(0, int(self.PROGRESS_INTERVAL_MS - elapsed_ms)), self._flush
+            )
+    
+    def _flush(self):
+        """Draw the most recent progress values."""
+        # Clear first so values posted while drawing schedule another flush
+        self._flush_id = None
+        pending, self._pending = self._pending, None
+        if pending is None or self.cancelled or not self.dialog.winfo_exists():
+            return
+        
+        current, total, message = pending
         if total > 0:
-            percentage = (current / total) * 100
-            self.progress_var.set(percentage)
-            status_msg = f"{message} ({current}/{total})"
+            self._draw(current / total, f"{message} ({current}/{total})")
         else:
-            status_msg = message
+            self._draw(None, message)
         
-        self.status_var.set(status_msg)
-        self.dialog.update_idletasks()
+        # Runs from the Tk event loop, so the canvas repaints on the next idle
+        # pass without forcing geometry or paint here
+        self._last_draw = time.monotonic()
+    
+    def _draw(self, fraction: Optional[float], status_msg: str):
+        """Move the bar fill and replace the status text."""
+        if fraction is not None:
+            self.canvas.coords('fill', 0, 0, self.CANVAS_WIDTH * fraction, self.BAR_HEIGHT)
+        self.canvas.itemconfigure('status', text=status_msg)
     
     def set_cancel_callback(self, callback: Callable):
         """Set callback for cancel button."""
         self.cancel_callback = callback
     
     def _on_cancel(self):
-        """Handle cancel button click."""
+        """Handle cancel button click by asking for confirmation inline."""
+        self.cancel_button.pack_forget()
+        self.confirm_frame.pack(pady=(0, 20))
+    
+    def _confirm_cancel(self):
+        """Cancel processing after the user confirmed."""
         self.cancelled = True
         if self.cancel_callback:
             self.cancel_callback()
         self.close()
     
+    def _dismiss_confirm(self):
+        """Hide the confirmation and restore the cancel button."""
+        if self.confirm_frame.winfo_manager():
+            self.confirm_frame.pack_forget()
+            self.cancel_button.pack(pady=(0, 20))
+    
     def close(self):
-        """Close the dialog."""
+        """Hide the dialog; it is reused by the next show()."""
         if self.dialog and self.dialog.winfo_exists():
-            self.dialog.destroy()
+            # Drop any queued redraw so the pooled dialog stays idle while hidden
+            if self._flush_id is not None:
+                self.dialog.after_cancel(self._flush_id)
+                self._flush_id = None
+            self._pending = None
+            self.dialog.grab_release()
+            self.dialog.withdraw()
 
 
 class SettingsTab:
     """Settings tab with advanced configuration options."""
     
+    # Height reserved for a section until its widgets are built
+    SECTION_PLACEHOLDER_HEIGHT = 150
+    
+    # Default value for every setting returned by get_settings()
+    DEFAULT_SETTINGS = {
+        'similarity_threshold': 10,
+        'chunk_size': 1200,
+        'hash_algorithm': 'average',
+        'language': 'en',
+        'recursive_scan': False,
+        'auto_export': False,
+        'compression_level': 1,
+        'archive_format': 'zip',
+        'use_async': True  # Enable async by default
+    }
+    
     def __init__(self, parent_frame, theme: PictureFinderTheme):
         """
         Initialize settings tab.
@@ -124,15 +371,49 @@ class SettingsTab:
         self.logger = get_logger()
         
         # Settings variables
-        self.similarity_threshold = tk.IntVar(value=10)
-        self.chunk_size = tk.IntVar(value=500)
-        self.hash_algorithm = tk.StringVar(value='average')
-        self.language = tk.StringVar(value='en')
-        self.recursive_scan = tk.BooleanVar(value=False)
-        self.auto_export = tk.BooleanVar(value=False)
-        self.compression_level = tk.IntVar(value=6)
-        self.use_async = tk.BooleanVar(value=True)  # Enable async by default
-        
+        defaults = self.DEFAULT_SETTINGS
+        self.similarity_threshold = tk.IntVar(value=defaults['similarity_threshold'])
+        self.chunk_size = tk.IntVar(value=defaults['chunk_size'])
+        self.hash_algorithm = tk.StringVar(value=defaults['hash_algorithm'])
+        self.language = tk.StringVar(value=defaults['language'])
+        self.recursive_scan = tk.BooleanVar(value=defaults['recursive_scan'])
+        self.auto_export = tk.BooleanVar(value=defaults['auto_export'])
+        self.compression_level = tk.IntVar(value=defaults['compression_level'])
+        self.archive_format = tk.StringVar(value=defaults['archive_format'])
+        self.use_async = tk.BooleanVar(value=defaults['use_async'])
+        
+        # Plain Python copies of the settings, so get_settings() makes no Tcl calls.
+        # Slider values are copied in their callbacks; the rest follow write traces.
+        self._values: Dict[str, Any] = dict(defaults)
+        for name in ('hash_algorithm', 'language', 'recursive_scan', 'auto_export',
+                     'archive_format', 'use_async'):
+            self._shadow_variable(name, getattr(self, name))
+        
+        # Widgets are built the first time the tab is shown
+        self._built = False
+        
+        # Pending scrollregion refresh for the settings canvas
+        self._canvas: Optional[tk.Canvas] = None
+        self._scroll_pending: Optional[str] = None
+        
+        # Pending after() ids for slider value labels
+        self._label_updates: Dict[ttk.Label, str] = {}
+        
+        # Sections not yet built, as (frame, placeholder, builder)
+        self._pending_sections: list = []
+        self._realize_scheduled = False
+        self._scrollbar: Optional[ttk.Scrollbar] = None
+        
+        # Value labels, set once their section is built
+        self.threshold_value_label: Optional[ttk.Label] = None
+        self.chunk_value_label: Optional[ttk.Label] = None
+        self.compression_value_label: Optional[ttk.Label] = None
+    
+    def _ensure_built(self):
+        """Build the settings widgets on first display."""
+        if self._built:
+            return
+        self._built = True
         self._create_widgets()
     
     def _create_widgets(self):
@@ -141,14 +422,13 @@ class SettingsTab:
         canvas = tk.Canvas(self.frame, bg=self.theme.get_color('primary_bg'))
         scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas, style='PF.TFrame')
+        self._canvas = canvas
+        self._scrollbar = scrollbar
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        scrollable_frame.bind("<Configure>", self._schedule_scrollregion_update)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.configure(yscrollcommand=self._on_canvas_scroll)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -162,20 +442,50 @@ class SettingsTab:
         )
         header_label.pack(pady=(20, 15))
         
-        # Detection Settings Section
-        detection_frame = ttk.LabelFrame(
+        # Sections are created as empty frames; their widgets are built the
+        # first time each one scrolls into view
+        section_specs = (
+            (f"{ICONS['image']} Detection Settings", self._build_detection_section),
+            (f"{ICONS['cpu']} Performance Settings", self._build_performance_section),
+            (f"{ICONS['folder']} Scan Options", self._build_scan_section),
+            (f"{ICONS['zip']} Export Settings", self._build_export_section),
+            (f"{ICONS['settings']} Language Settings", self._build_language_section),
+        )
+        
+        for title, builder in section_specs:
+            section_frame = ttk.LabelFrame(
+                scrollable_frame,
+                text=title,
+                style='Card.TFrame'
+            )
+            section_frame.pack(fill='x', padx=10, pady=5)
+            
+            # Placeholder keeps an unbuilt section roughly its final height
+            placeholder = ttk.Frame(section_frame, height=self.SECTION_PLACEHOLDER_HEIGHT)
+            placeholder.pack(fill='x')
+            self._pending_sections.append((section_frame, placeholder, builder))
+        
+        # Reset Settings Button
+        reset_button = create_icon_button(
             scrollable_frame,
-            text=f"{ICONS['image']} Detection Settings",
-            style='Card.TFrame'
+            "Reset to Defaults",
+            command=self._reset_settings,
+            icon_char=ICONS['refresh'],
+            style='Secondary.TButton'
         )
-        detection_frame.pack(fill='x', padx=10, pady=5)
+        reset_button.pack(pady=10)
         
+        add_tooltip(reset_button, "Reset all settings to their default values")
+    
+    def _build_detection_section(self, detection_frame: ttk.LabelFrame):
+        """Populate the Detection Settings section."""
         # Similarity threshold
-        ttk.Label(
+        self.threshold_value_label = ttk.Label(
             detection_frame,
             text=f"Similarity Threshold: {self.similarity_threshold.get()}",
             style='PF.TLabel'
-        ).pack(anchor='w', padx=10, pady=(10, 5))
+        )
+        self.threshold_value_label.pack(anchor='w', padx=10, pady=(10, 5))
         
         ttk.Label(
             detection_frame,
@@ -223,31 +533,26 @@ class SettingsTab:
             "Difference: Good for cropped images. "
             "Wavelet: Best accuracy but slower."
         )
-        
-        # Performance Settings Section
-        performance_frame = ttk.LabelFrame(
-            scrollable_frame,
-            text=f"{ICONS['cpu']} Performance Settings",
-            style='Card.TFrame'
-        )
-        performance_frame.pack(fill='x', padx=10, pady=5)
-        
+    
+    def _build_performance_section(self, performance_frame: ttk.LabelFrame):
+        """Populate the Performance Settings section."""
         # Batch size
-        ttk.Label(
+        self.chunk_value_label = ttk.Label(
             performance_frame,
             text=f"Batch Size: {self.chunk_size.get()}",
             style='PF.TLabel'
-        ).pack(anchor='w', padx=10, pady=(10, 5))
+        )
+        self.chunk_value_label.pack(anchor='w', padx=10, pady=(10, 5))
         
         ttk.Label(
             performance_frame,
-            text="Files processed per batch (100-2000)",
+            text="Files processed per batch (100-5000)",
             style='Status.TLabel'
         ).pack(anchor='w', padx=10)
         
         self.chunk_scale = ttk.Scale(
             performance_frame,
-            from_=100, to=2000,
+            from_=100, to=5000,
             orient='horizontal',
             variable=self.chunk_size,
             style='PF.TScale',
@@ -261,14 +566,23 @@ class SettingsTab:
             "Lower values = slower but more memory efficient."
         )
         
-        # Scan Options Section
-        scan_frame = ttk.LabelFrame(
-            scrollable_frame,
-            text=f"{ICONS['folder']} Scan Options",
-            style='Card.TFrame'
+        # Async processing checkbox
+        async_check = ttk.Checkbutton(
+            performance_frame,
+            text="Enable Async Processing (Recommended)",
+            variable=self.use_async,
+            style='PF.TCheckbutton'
         )
-        scan_frame.pack(fill='x', padx=10, pady=5)
+        async_check.pack(anchor='w', padx=10, pady=(0, 5))
         
+        ttk.Label(
+            performance_frame,
+            text="Async processing provides better performance and responsiveness",
+            style='Status.TLabel'
+        ).pack(anchor='w', padx=10, pady=(0, 10))
+    
+    def _build_scan_section(self, scan_frame: ttk.LabelFrame):
+        """Populate the Scan Options section."""
         # Recursive scanning
         ttk.Checkbutton(
             scan_frame,
@@ -276,15 +590,9 @@ class SettingsTab:
             variable=self.recursive_scan,
             style='PF.TCheckbutton'
         ).pack(anchor='w', padx=10, pady=5)
-        
-        # Export Settings Section
-        export_frame = ttk.LabelFrame(
-            scrollable_frame,
-            text=f"{ICONS['zip']} Export Settings",
-            style='Card.TFrame'
-        )
-        export_frame.pack(fill='x', padx=10, pady=5)
-        
+    
+    def _build_export_section(self, export_frame: ttk.LabelFrame):
+        """Populate the Export Settings section."""
         # Auto export checkbox
         ttk.Checkbutton(
             export_frame,
@@ -294,11 +602,12 @@ class SettingsTab:
         ).pack(anchor='w', padx=10, pady=5)
         
         # Compression level
-        ttk.Label(
+        self.compression_value_label = ttk.Label(
             export_frame,
             text=f"Compression Level: {self.compression_level.get()}",
             style='PF.TLabel'
-        ).pack(anchor='w', padx=10, pady=(5, 0))
+        )
+        self.compression_value_label.pack(anchor='w', padx=10, pady=(5, 0))
         
         ttk.Label(
             export_frame,
@@ -314,16 +623,46 @@ class SettingsTab:
             style='PF.TScale',
             command=self._on_compression_change
         )
-        self.compression_scale.pack(fill='x', padx=10, pady=(0, 10))
+        self.compression_scale.pack(fill='x', padx=10, pady=(0, 5))
         
-        # Language Settings Section
-        lang_frame = ttk.LabelFrame(
-            scrollable_frame,
-            text=f"{ICONS['settings']} Language Settings",
-            style='Card.TFrame'
+        compression_tip = ("Level 1: fastest, ~same size on media. "
+                           "Level 6: balanced. Level 9: diminishing returns.")
+        add_tooltip(self.compression_scale, compression_tip)
+        
+        # Compression presets
+        preset_frame, _ = create_radio_group(
+            export_frame,
+            self.compression_level,
+            [(1, "Fast"), (6, "Balanced"), (9, "Max")],
+            command=lambda: self._on_compression_change(self.compression_level.get()),
+            side='left',
+            padx=(0, 10)
+        )
+        preset_frame.pack(anchor='w', padx=10, pady=(0, 10))
+        add_tooltip(preset_frame, compression_tip)
+        
+        # Archive format, limited to the tools available on this system
+        from core.file_manager import FileManager
+        
+        ttk.Label(
+            export_frame,
+            text="Archive Format:",
+            style='PF.TLabel'
+        ).pack(anchor='w', padx=10, pady=(5, 0))
+        
+        format_combo = ttk.Combobox(
+            export_frame,
+            textvariable=self.archive_format,
+            values=FileManager.available_archive_formats(),
+            state='readonly',
+            width=20
         )
-        lang_frame.pack(fill='x', padx=10, pady=5)
+        format_combo.pack(anchor='w', padx=10, pady=(0, 10))
         
+        add_tooltip(format_combo, "tar.gz uses pigz and 7z uses py7zr for multi-core compression")
+    
+    def _build_language_section(self, lang_frame: ttk.LabelFrame):
+        """Populate the Language Settings section."""
         ttk.Label(
             lang_frame,
             text="Language:",
@@ -338,112 +677,118 @@ class SettingsTab:
             width=20
         )
         language_combo.pack(anchor='w', padx=10, pady=(0, 10))
-        
-        # Performance Settings Section
-        perf_frame = ttk.LabelFrame(
-            scrollable_frame,
-            text=f"{ICONS['settings']} Performance Settings",
-            style='Card.TFrame'
-        )
-        perf_frame.pack(fill='x', padx=10, pady=5)
-        
-        # Async processing checkbox
-        async_check = ttk.Checkbutton(
-            perf_frame,
-            text="Enable Async Processing (Recommended)",
-            variable=self.use_async,
-            style='PF.TCheckbutton'
-        )
-        async_check.pack(anchor='w', padx=10, pady=10)
-        
-        ttk.Label(
-            perf_frame,
-            text="Async processing provides better performance and responsiveness",
-            style='Status.TLabel'
-        ).pack(anchor='w', padx=10, pady=(0, 10))
-        
-        # Reset Settings Button
-        reset_button = create_icon_button(
-            scrollable_frame,
-            "Reset to Defaults",
-            command=self._reset_settings,
-            icon_char=ICONS['refresh'],
-            style='Secondary.TButton'
-        )
-        reset_button.pack(pady=10)
-        
-        add_tooltip(reset_button, "Reset all settings to their default values")
+    
+    def _on_canvas_scroll(self, first, last):
+        """Update the scrollbar and build any sections that scrolled into view."""
+        self._scrollbar.set(first, last)
+        if self._pending_sections and not self._realize_scheduled:
+            self._realize_scheduled = True
+            self._canvas.after_idle(self._realize_visible_sections)
+    
+    def _realize_visible_sections(self):
+        """Build the widgets of pending sections that intersect the viewport."""
+        self._realize_scheduled = False
+        top = self._canvas.canvasy(0)
+        bottom = self._canvas.canvasy(self._canvas.winfo_height())
+        
+        still_pending = []
+        for section_frame, placeholder, builder in self._pending_sections:
+            y = section_frame.winfo_y()
+            if y < bottom and y + section_frame.winfo_height() > top:
+                placeholder.destroy()
+                builder(section_frame)
+            else:
+                still_pending.append((section_frame, placeholder, builder))
+        self._pending_sections = still_pending
+    
+    def _schedule_scrollregion_update(self, event=None):
+        """Refresh the canvas scrollregion once the burst of <Configure> events settles."""
+        if self._scroll_pending is not None:
+            self._canvas.after_cancel(self._scroll_pending)
+        self._scroll_pending = self._canvas.after(40, self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        """Fit the canvas scrollregion to its contents."""
+        self._scroll_pending = None
+        self._canvas.configure(scrollregion=self._canvas.bbox("all"))
+    
+    def _shadow_variable(self, name: str, variable: tk.Variable):
+        """Keep self._values[name] in step with a Tk variable."""
+        def on_write(*args):
+            self._values[name] = variable.get()
+        variable.trace_add('write', on_write)
     
     def _on_threshold_change(self, value):
         """Handle similarity threshold change."""
         val = int(float(value))
+        if val == self._values['similarity_threshold']:
+            return  # Drag stayed within the same step
+        self._values['similarity_threshold'] = val
         self.similarity_threshold.set(val)
-        
-        # Update label in parent
-        parent = self.threshold_scale.master
-        for child in parent.winfo_children():
-            if isinstance(child, ttk.Label) and "Similarity Threshold" in str(child.cget('text')):
-                child.configure(text=f"Similarity Threshold: {val}")
-                break
+        self._update_value_label(self.threshold_value_label, f"Similarity Threshold: {val}")
     
     def _on_chunk_change(self, value):
         """Handle chunk size change."""
         val = int(float(value))
+        if val == self._values['chunk_size']:
+            return  # Drag stayed within the same step
+        self._values['chunk_size'] = val
         self.chunk_size.set(val)
-        
-        # Update label
-        parent = self.chunk_scale.master
-        for child in parent.winfo_children():
-            if isinstance(child, ttk.Label) and "Batch Size" in str(child.cget('text')):
-                child.configure(text=f"Batch Size: {val}")
-                break
+        self._update_value_label(self.chunk_value_label, f"Batch Size: {val}")
     
     def _on_compression_change(self, value):
         """Handle compression level change."""
         val = int(float(value))
+        if val == self._values['compression_level']:
+            return  # Drag stayed within the same step
+        self._values['compression_level'] = val
         self.compression_level.set(val)
-        
-        # Update label
-        parent = self.compression_scale.master
-        for child in parent.winfo_children():
-            if isinstance(child, ttk.Label) and "Compression Level" in str(child.cget('text')):
-                child.configure(text=f"Compression Level: {val}")
-                break
+        self._update_value_label(self.compression_value_label, f"Compression Level: {val}")
+    
+    def _update_value_label(self, label: Optional[ttk.Label], text: str):
+        """Set a slider's value label, coalescing rapid drag events into one update."""
+        if label is None:
+            return  # Section not built yet; it reads the variable when it is
+        
+        pending = self._label_updates.get(label)
+        if pending is not None:
+            self.frame.after_cancel(pending)
+        self._label_updates[label] = self.frame.after(30, label.configure, {'text': text})
     
     def _reset_settings(self):
         """Reset all settings to defaults."""
         if messagebox.askyesno("Reset Settings", "Reset all settings to default values?"):
-            self.similarity_threshold.set(10)
-            self.chunk_size.set(500)
-            self.hash_algorithm.set('average')
-            self.language.set('en')
-            self.recursive_scan.set(False)
-            self.auto_export.set(False)
-            self.compression_level.set(6)
-            self.use_async.set(True)  # Reset async to enabled
+            defaults = self.DEFAULT_SETTINGS
+            self.hash_algorithm.set(defaults['hash_algorithm'])
+            self.language.set(defaults['language'])
+            self.recursive_scan.set(defaults['recursive_scan'])
+            self.auto_export.set(defaults['auto_export'])
+            self.archive_format.set(defaults['archive_format'])
+            self.use_async.set(defaults['use_async'])
             
-            # Update scale labels
-            self._on_threshold_change(10)
-            self._on_chunk_change(500)
-            self._on_compression_change(6)
+            # Sliders: set the variables and update their labels
+            self.similarity_threshold.set(defaults['similarity_threshold'])
+            self.chunk_size.set(defaults['chunk_size'])
+            self.compression_level.set(defaults['compression_level'])
+            self._on_threshold_change(defaults['similarity_threshold'])
+            self._on_chunk_change(defaults['chunk_size'])
+            self._on_compression_change(defaults['compression_level'])
     
     def get_settings(self) -> Dict[str, Any]:
         """Get current settings as dictionary."""
-        return {
-            'similarity_threshold': self.similarity_threshold.get(),
-            'chunk_size': self.chunk_size.get(),
-            'hash_algorithm': self.hash_algorithm.get(),
-            'language': self.language.get(),
-            'recursive_scan': self.recursive_scan.get(),
-            'auto_export': self.auto_export.get(),
-            'compression_level': self.compression_level.get(),
-            'use_async': self.use_async.get()
-        }
+        return dict(self._values)
 
 
 class MainTab:
     """Main tab with folder selection and processing controls."""
     
+    # Statistics display layout
+    STATS_LINES = 6
+    STATS_LINE_HEIGHT = 15
+    
+    # Milliseconds between checks of the worker queues while a worker is running
+    EVENT_POLL_MS = 50
+    
     def __init__(self, parent_frame, theme: PictureFinderTheme, settings_tab: SettingsTab):
         """
         Initialize main tab.
@@ -465,9 +810,40 @@ class MainTab:
         self.status_text = tk.StringVar(value="Ready to process photos")
         
         # Processing state
-        self.processor: Optional[ImageProcessor] = None
+        self.processor: Optional['ImageProcessor'] = None
         self.processing_thread: Optional[threading.Thread] = None
+        self.export_thread: Optional[threading.Thread] = None
+        self._log_thread: Optional[threading.Thread] = None
+        self.last_results: Optional[Dict[str, Any]] = None
+        self._unique_folder_sig: Optional[tuple] = None
+        self._unique_folder_empty = True
         self.progress_dialog: Optional[ProgressDialog] = None
+        self._progress_q: queue.Queue = queue.Queue()
+        self._busy = tk.BooleanVar(value=False)
+        
+        # Worker threads only put (kind, *args) events here; the Tk thread polls
+        # the queues with after() while a worker is running
+        self._event_q: queue.Queue = queue.Queue()
+        self._poll_id: Optional[str] = None
+        self._event_handlers: Dict[str, Callable] = {
+            'status': self._set_status,
+            'complete': self._processing_completed,
+            'failed': self._processing_failed,
+            'export': self._export_finished,
+            'warning': messagebox.showwarning,
+            'error': messagebox.showerror,
+        }
+        
+        # Coalesced display updates
+        self._pending_status: Optional[str] = None
+        self._pending_stats: Optional[str] = None
+        self._display_flush_scheduled = False
+        self._in_batch = False
+        self._stats_lines = [''] * self.STATS_LINES
+        self._last_stats = ''
+        
+        # Help window, built on first use
+        self._help_window: Optional[tk.Toplevel] = None
         
         self._create_widgets()
     
@@ -541,26 +917,15 @@ class MainTab:
         ).pack(anchor='w', pady=(0, 5))
         
         # Radio buttons for copy/move
-        radio_frame = ttk.Frame(operation_frame, style='PF.TFrame')
-        radio_frame.pack(fill='x')
-        
-        copy_radio = ttk.Radiobutton(
-            radio_frame,
-            text=f"{ICONS['copy']} Copy (Keep originals)",
-            variable=self.operation_mode,
-            value='copy',
-            style='PF.TRadiobutton'
-        )
-        copy_radio.pack(anchor='w', pady=2)
-        
-        move_radio = ttk.Radiobutton(
-            radio_frame,
-            text=f"{ICONS['move']} Move (Remove originals)",
-            variable=self.operation_mode,
-            value='move',
-            style='PF.TRadiobutton'
+        radio_frame, (copy_radio, move_radio) = create_radio_group(
+            operation_frame,
+            self.operation_mode,
+            [('copy', f"{ICONS['copy']} Copy (Keep originals)"),
+             ('move', f"{ICONS['move']} Move (Remove originals)")],
+            anchor='w',
+            pady=2
         )
-        move_radio.pack(anchor='w', pady=2)
+        radio_frame.pack(fill='x')
         
         add_tooltip(copy_radio, "Copy unique photos to 'unique_photos' folder (original files remain)")
         add_tooltip(move_radio, "Move unique photos to 'unique_photos' folder (original files are moved)")
@@ -576,21 +941,21 @@ class MainTab:
             font=('Helvetica', 10, 'bold')
         ).pack(anchor='w', pady=(0, 5))
         
+        # Display labels map straight back to the processor's mode tags
+        self._perf_mode_map = {
+            'Low (1 core, minimal RAM)': 'low',
+            'Medium (2 cores, moderate RAM)': 'medium',
+            'High (4 cores, high RAM)': 'high'
+        }
+        
         perf_combo = ttk.Combobox(
             perf_frame,
             textvariable=self.performance_mode,
-            values=['low', 'medium', 'high'],
+            values=list(self._perf_mode_map),
             state='readonly',
             width=30
         )
         perf_combo.pack(anchor='w')
-        
-        # Set combobox display values
-        perf_combo.configure(values=[
-            'Low (1 core, minimal RAM)',
-            'Medium (2 cores, moderate RAM)',
-            'High (4 cores, high RAM)'
-        ])
         perf_combo.set('High (4 cores, high RAM)')
         
         add_tooltip(
@@ -626,6 +991,9 @@ class MainTab:
         self.export_button.pack(side='left', padx=(0, 10))
         self.export_button.configure(state='disabled')
         
+        # Action buttons follow the busy flag instead of being toggled at each call site
+        self._busy.trace_add('write', self._on_busy_changed)
+        
         self.view_logs_button = create_icon_button(
             button_frame,
             "View Logs",
@@ -660,17 +1028,26 @@ class MainTab:
         stats_frame = ttk.Frame(progress_frame, style='PF.TFrame')
         stats_frame.pack(fill='x', padx=10, pady=(0, 10))
         
-        self.stats_text = tk.Text(
+        # One canvas text item per statistics line, replaced in place on update
+        stats_bg = self.theme.get_color('secondary_bg')
+        stats_fg = self.theme.get_color('text_dark')
+        stats_font = ('Courier', 9)
+        
+        self.stats_canvas = tk.Canvas(
             stats_frame,
-            height=4,
-            width=50,
-            wrap='word',
-            background=self.theme.get_color('secondary_bg'),
-            foreground=self.theme.get_color('text_dark'),
-            font=('Courier', 9),
-            state='disabled'
+            height=self.STATS_LINES * self.STATS_LINE_HEIGHT + 8,
+            background=stats_bg,
+            highlightthickness=0
         )
-        self.stats_text.pack(fill='x')
+        for i in range(self.STATS_LINES):
+            self.stats_canvas.create_text(
+                5, 4 + i * self.STATS_LINE_HEIGHT,
+                anchor='nw',
+                fill=stats_fg,
+                font=stats_font,
+                tags=f'stat{i}'
+            )
+        self.stats_canvas.pack(fill='x')
         
         # Help section
         help_frame = ttk.Frame(main_container, style='PF.TFrame')
@@ -687,7 +1064,7 @@ class MainTab:
         
         add_tooltip(help_button, "Open help documentation and user guide")
     
-    def _browse_folder(self):
+    def _browse_folder(self, event=None):
         """Open folder browser dialog."""
         folder = filedialog.askdirectory(
             title="Select folder containing photos",
@@ -696,10 +1073,10 @@ class MainTab:
         
         if folder:
             self.folder_path.set(folder)
-            self.status_text.set(f"Selected: {folder}")
+            self._set_status(f"Selected: {folder}")
             self.logger.log_info(f"User selected folder: {folder}")
     
-    def _start_processing(self):
+    def _start_processing(self, event=None):
         """Start the photo processing in a separate thread."""
         folder = self.folder_path.get().strip()
         
@@ -707,7 +1084,7 @@ class MainTab:
             messagebox.showerror("Error", "Please select a folder first!")
             return
         
-        if not os.path.exists(folder):
+        if self._folder_exists(folder) is False:
             messagebox.showerror("Error", "Selected folder does not exist!")
             return
         
@@ -715,32 +1092,25 @@ class MainTab:
         settings = self.settings_tab.get_settings()
         
         # Extract performance mode
-        perf_mode_text = self.performance_mode.get()
-        if 'Low' in perf_mode_text:
-            perf_mode = 'low'
-        elif 'Medium' in perf_mode_text:
-            perf_mode = 'medium'
-        else:
-            perf_mode = 'high'
+        perf_mode = self._perf_mode_map.get(self.performance_mode.get(), 'high')
         
         # Confirm action
         mode_text = "copy" if self.operation_mode.get() == 'copy' else "move"
-        message = (
-            f"Start processing photos in:\n{folder}\n\n"
-            f"Action: {mode_text.title()} unique photos\n"
-            f"Performance: {perf_mode.title()}\n"
-            f"Recursive: {'Yes' if settings['recursive_scan'] else 'No'}\n\n"
-            "Continue?"
-        )
+        message = CONFIRM_TEMPLATE.format_map({
+            'folder': folder,
+            'action': mode_text.title(),
+            'performance': perf_mode.title(),
+            'recursive': 'Yes' if settings['recursive_scan'] else 'No'
+        })
         
         if not messagebox.askyesno("Confirm Processing", message):
             return
         
         # Disable buttons during processing
-        self.run_button.configure(state='disabled')
-        self.export_button.configure(state='disabled')
+        self._busy.set(True)
         
         # Create processor
+        from core.image_processor import ImageProcessor
         self.processor = ImageProcessor(
             output_dir=os.getcwd(),
             performance_mode=perf_mode,
@@ -749,7 +1119,9 @@ class MainTab:
         )
         
         # Show progress dialog
-        self.progress_dialog = ProgressDialog(self.frame.winfo_toplevel(), "Processing Photos")
+        self.progress_dialog = ProgressDialog.show(
+            self.frame.winfo_toplevel(), self.theme, "Processing Photos"
+        )
         self.progress_dialog.set_cancel_callback(self._cancel_processing)
         
         # Set up progress callback
@@ -758,268 +1130,507 @@ class MainTab:
         # Start processing thread
         self.processing_thread = threading.Thread(
             target=self._process_photos,
-            args=(folder, settings),
+            args=(folder, self.operation_mode.get(), settings),
             daemon=True
         )
         self.processing_thread.start()
+        self._watch_workers()
     
-    def _process_photos(self, folder: str, settings: Dict[str, Any]):
+    def _folder_exists(self, folder: str) -> Optional[bool]:
+        """
+        Check that a folder exists without letting a slow mount freeze the UI.
+        
+        Args:
+            folder: Folder path to check
+            
+        Returns:
+            True/False, or None if the check did not finish within 0.5s
+        """
+        # A fresh daemon thread per check: one stuck on a dead mount neither
+        # delays later checks nor blocks interpreter exit
+        result: queue.Queue = queue.Queue(maxsize=1)
+        threading.Thread(
+            target=lambda: result.put(os.path.exists(folder)),
+            daemon=True
+        ).start()
+        
+        try:
+            return result.get(timeout=0.5)
+        except queue.Empty:
+            # Proceed; the worker reports the failure if the folder is unreachable
+            self.logger.log_info(f"Folder check timed out, continuing: {folder}")
+            return None
+    
+    def _process_photos(self, folder: str, mode: str, settings: Dict[str, Any]):
         """Process photos in background thread with async support."""
         try:
-            self.status_text.set("Processing photos...")
+            self._post_event('status', "Processing photos...")
 
             # Check if async processing is available and enabled
             use_async = hasattr(self.processor, 'async_process_folder') and settings.get('use_async', True)
 
             if use_async:
                 # Use asyncio for non-blocking processing
-                asyncio.run(self._async_process_photos(folder, settings))
+                asyncio.run(self._async_process_photos(folder, mode, settings))
             else:
                 # Fallback to synchronous processing
                 results = self.processor.process_folder(
                     folder_path=folder,
-                    mode=self.operation_mode.get(),
+                    mode=mode,
                     chunk_size=settings['chunk_size'],
                     recursive=settings['recursive_scan'],
                     export_zip=settings['auto_export']
                 )
-                # Update UI on main thread
-                self.frame.after(0, self._processing_completed, results)
+                # Hand the results to the main thread
+                self._post_event('complete', results)
 
         except Exception as e:
             self.logger.log_error(f"Processing failed: {str(e)}")
-            self.frame.after(0, self._processing_failed, str(e))
+            self._post_event('failed', str(e))
 
-    async def _async_process_photos(self, folder: str, settings: Dict[str, Any]):
+    async def _async_process_photos(self, folder: str, mode: str, settings: Dict[str, Any]):
         """Async version of photo processing."""
         try:
             # Process folder asynchronously
             results = await self.processor.async_process_folder(
                 folder_path=folder,
-                mode=self.operation_mode.get(),
+                mode=mode,
                 chunk_size=settings['chunk_size'],
                 recursive=settings['recursive_scan'],
                 export_zip=settings['auto_export']
             )
 
-            # Update UI on main thread
-            self.frame.after(0, self._processing_completed, results)
+            # Hand the results to the main thread
+            self._post_event('complete', results)
 
         except Exception as e:
             self.logger.log_error(f"Async processing failed: {str(e)}")
-            self.frame.after(0, self._processing_failed, str(e))
+            self._post_event('failed', str(e))
     
-    def _update_progress(self, current: int, total: int, message: str):
-        """Update progress dialog from processing thread."""
-        if self.progress_dialog:
-            self.progress_dialog.update_progress(current, total, message)
+    def _post_event(self, kind: str, *args):
+        """Queue a worker event for the Tk thread; makes no Tk calls, so any thread may call it."""
+        self._event_q.put((kind, *args))
     
-    def _processing_completed(self, results: Dict[str, Any]):
-        """Handle processing completion on main thread."""
-        if self.progress_dialog:
-            self.progress_dialog.close()
-            self.progress_dialog = None
-        
-        # Update statistics display
-        stats_text = (
-            f"Processing completed in {results['processing_time']:.1f} seconds\n"
-            f"Files scanned: {results['detection_stats']['total_files']:,}\n"
-            f"Duplicate groups: {results['duplicate_groups']:,}\n"
-            f"Total duplicates: {results['total_duplicates']:,}\n"
-            f"Unique files processed: {results['unique_files_processed']:,}\n"
-            f"Videos separated: {results['detection_stats']['videos_separated']:,}"
-        )
-        
-        self._update_stats_display(stats_text)
-        
-        # Enable export button if unique photos were processed
-        if results['unique_files_processed'] > 0:
-            self.export_button.configure(state='normal')
-        
-        # Show completion message
-        message = (
-            f"Processing completed successfully!\n\n"
-            f"• {results['total_duplicates']:,} duplicates found\n"
-            f"• {results['unique_files_processed']:,} unique photos processed\n"
-            f"• {results['detection_stats']['videos_separated']:,} videos separated\n\n"
-            "Check the output folders for results."
+    def _watch_workers(self):
+        """Start polling the worker queues, unless already polling. Tk thread only."""
+        if self._poll_id is None:
+            self._poll_id = self.frame.after(self.EVENT_POLL_MS, self._drain_events)
+    
+    def _workers_running(self) -> bool:
+        """Whether any background worker that posts events is still alive."""
+        return any(
+            thread is not None and thread.is_alive()
+            for thread in (self.processing_thread, self.export_thread, self._log_thread)
         )
+    
+    def _drain_events(self):
+        """Dispatch queued worker events on the main thread."""
+        self._poll_id = None
+        self._drain_progress()
+        
+        while True:
+            try:
+                kind, *args = self._event_q.get_nowait()
+            except queue.Empty:
+                break
+            self._event_handlers[kind](*args)
         
-        if results.get('zip_export_path'):
-            message += f"\n\nZIP export: {results['zip_export_path']}"
-        
-        messagebox.showinfo("Processing Complete", message)
-        
-        # Re-enable buttons
-        self.run_button.configure(state='normal')
+        # Check the workers before the queue: a worker that has exited has
+        # already queued everything it will post
+        if self._workers_running() or not self._event_q.empty():
+            self._watch_workers()
+    
+    def _drain_progress(self):
+        """Show only the newest queued progress update."""
+        latest = None
+        while True:
+            try:
+                latest = self._progress_q.get_nowait()
+            except queue.Empty:
+                break
         
-        self.status_text.set("Processing completed successfully")
-        self.logger.log_info("Processing completed successfully")
+        if latest is not None and self.progress_dialog:
+            self.progress_dialog.update_progress(*latest)
+    
+    def _update_progress(self, current: int, total: int, message: str):
+        """Queue a progress update; the processor already reports once per group of files."""
+        self._progress_q.put_nowait((current, total, message))
+    
+    def _processing_completed(self, results: Dict[str, Any]):
+        """Handle processing completion on main thread."""
+        with self._batch_ui():
+            self.last_results = results
+            
+            if self.progress_dialog:
+                self.progress_dialog.close()
+                self.progress_dialog = None
+            
+            # Top-level results take precedence over the detection-only stats
+            values = {**results['detection_stats'], **results}
+            
+            # Update statistics display
+            self._update_stats_display(STATS_TEMPLATE.format_map(values))
+            
+            # Enable export button if unique photos were processed
+            if results['unique_files_processed'] > 0:
+                self.export_button.configure(state='normal')
+            
+            # Show completion message
+            message = COMPLETION_TEMPLATE.format_map(values)
+            
+            if results.get('zip_export_path'):
+                message += f"\n\nZIP export: {results['zip_export_path']}"
+            
+            # Re-enable buttons
+            self._busy.set(False)
+            
+            self._set_status("Processing completed successfully")
+            self.logger.log_info("Processing completed successfully")
+            
+            # Show the modal once the event loop is idle so the new state is drawn first
+            self.frame.after_idle(messagebox.showinfo, "Processing Complete", message)
     
     def _processing_failed(self, error_msg: str):
         """Handle processing failure on main thread."""
-        if self.progress_dialog:
-            self.progress_dialog.close()
-            self.progress_dialog = None
-        
-        # Re-enable buttons
-        self.run_button.configure(state='normal')
-        
-        self.status_text.set(f"Processing failed: {error_msg}")
-        
-        messagebox.showerror(
-            "Processing Failed",
-            f"An error occurred during processing:\n\n{error_msg}\n\nCheck the log file for details."
-        )
+        with self._batch_ui():
+            if self.progress_dialog:
+                self.progress_dialog.close()
+                self.progress_dialog = None
+            
+            # Re-enable buttons
+            self._busy.set(False)
+            
+            self._set_status(f"Processing failed: {error_msg}")
+            
+            self.frame.after_idle(
+                messagebox.showerror,
+                "Processing Failed",
+                f"An error occurred during processing:\n\n{error_msg}\n\nCheck the log file for details."
+            )
     
     def _cancel_processing(self):
         """Cancel current processing operation."""
         if self.processor:
             self.processor.cancel_processing()
         
-        self.status_text.set("Processing cancelled")
-        self.run_button.configure(state='normal')
+        self._set_status("Processing cancelled")
+        self._busy.set(False)
     
-    def _export_zip(self):
+    def _on_busy_changed(self, *args):
+        """Update action buttons when the busy flag changes."""
+        if self._busy.get():
+            self.run_button.configure(state='disabled')
+            self.export_button.configure(state='disabled')
+        else:
+            self.run_button.configure(state='normal')
+    
+    def _export_zip(self, event=None):
         """Export unique photos to ZIP file."""
+        # Ctrl+E bypasses the disabled Export button, so refuse here while
+        # processing is still writing unique_photos or an export is running
+        if self._busy.get() or any(
+            thread is not None and thread.is_alive()
+            for thread in (self.processing_thread, self.export_thread)
+        ):
+            return
+        
         unique_folder = Path("unique_photos")
         
-        if not unique_folder.exists() or not any(unique_folder.iterdir()):
+        # Prefer the files produced by the last run so they are read straight
+        # into the archive without re-walking the output folder
+        unique_paths = None
+        if self.last_results and self.last_results.get('unique_paths'):
+            unique_paths = list(self.last_results['unique_paths'])
+        
+        if unique_paths is None and self._is_folder_empty(unique_folder):
             messagebox.showwarning(
                 "No Files to Export",
                 "No unique photos found to export. Process photos first."
             )
             return
         
-        # Ask for ZIP file location
+        # Get compression settings
+        settings = self.settings_tab.get_settings()
+        archive_format = settings['archive_format']
+        label, extension = ARCHIVE_FILETYPES[archive_format]
+        
+        # Ask for archive file location
         zip_path = filedialog.asksaveasfilename(
-            title="Save ZIP file as",
-            defaultextension=".zip",
-            filetypes=[("ZIP files", "*.zip"), ("All files", "*.*")]
+            title=f"Save {label} as",
+            defaultextension=extension,
+            filetypes=[(label, f"*{extension}"), ("All files", "*.*")]
         )
         
         if not zip_path:
             return
         
-        # Get compression settings
-        settings = self.settings_tab.get_settings()
+        # Compression workers follow the Performance Mode core budget
+        perf_mode = self._perf_mode_map.get(self.performance_mode.get(), 'high')
+        max_workers = {'low': 1, 'medium': 2}.get(perf_mode, os.cpu_count() or 1)
+        
+        # Compress in the background; the UI is restored from _export_finished
+        self._busy.set(True)
+        self._set_status(f"Exporting unique photos to {archive_format.upper()}...")
         
+        self.export_thread = threading.Thread(
+            target=self._do_zip_export,
+            args=(unique_folder, zip_path, settings, unique_paths, max_workers),
+            daemon=True
+        )
+        self.export_thread.start()
+        self._watch_workers()
+    
+    def _is_folder_empty(self, folder: Path) -> bool:
+        """
+        Check whether a folder is missing or empty, rescanning only when it has changed.
+        
+        Args:
+            folder: Folder to check
+            
+        Returns:
+            True if the folder does not exist or has no entries
+        """
+        try:
+            stat = os.stat(folder)
+        except OSError:
+            self._unique_folder_sig = None
+            return True
+        
+        sig = (stat.st_mtime_ns, stat.st_size)
+        if sig != self._unique_folder_sig:
+            with os.scandir(folder) as entries:
+                self._unique_folder_empty = next(entries, None) is None
+            self._unique_folder_sig = sig
+        
+        return self._unique_folder_empty
+    
+    def _do_zip_export(self, unique_folder: Path, zip_path: str, settings: Dict[str, Any],
+                       unique_paths: Optional[list] = None, max_workers: int = 1):
+        """Create the export archive in a background thread."""
         try:
             from core.file_manager import FileManager
-            file_manager = FileManager()
+            file_manager = FileManager(recursive_scan=True)
+            archive_format = settings['archive_format']
+            unique_paths = self._media_paths(file_manager, unique_folder, unique_paths)
             
-            result = file_manager.export_to_zip(
-                str(unique_folder),
-                zip_path,
-                compression_level=settings['compression_level']
-            )
+            if archive_format == 'tar.gz':
+                result = file_manager.export_to_tar_gz(
+                    str(unique_folder),
+                    zip_path,
+                    compression_level=settings['compression_level'],
+                    file_paths=unique_paths
+                )
+            elif archive_format == '7z':
+                result = file_manager.export_to_7z(str(unique_folder), zip_path, file_paths=unique_paths)
+            else:
+                result = self._write_zip(
+                    file_manager, unique_folder, zip_path, settings, unique_paths, max_workers
+                )
             
             if result:
-                messagebox.showinfo(
-                    "Export Complete",
-                    f"Unique photos exported to:\n{zip_path}"
-                )
-                self.logger.log_info(f"ZIP export completed: {zip_path}")
+                self.logger.log_info(f"Archive export completed: {zip_path}")
+                self._post_event('export', True, f"Unique photos exported to:\n{zip_path}")
             else:
-                messagebox.showerror("Export Failed", "Failed to create ZIP file.")
+                self._post_event('export', False, "Failed to create archive.")
                 
         except Exception as e:
-            self.logger.log_error(f"ZIP export failed: {str(e)}")
-            messagebox.showerror("Export Failed", f"Error creating ZIP file:\n{str(e)}")
+            self.logger.log_error(f"Archive export failed: {str(e)}")
+            self._post_event('export', False, f"Error creating archive:\n{str(e)}")
+    
+    def _media_paths(self, file_manager, unique_folder: Path,
+                     unique_paths: Optional[list]) -> List[str]:
+        """
+        Select the photo and video files to export, dropping stray non-media files.
+        
+        Args:
+            file_manager: FileManager used to list the folder when no paths are given
+            unique_folder: Folder holding the unique photos
+            unique_paths: Files produced by the last run, or None to list unique_folder
+            
+        Returns:
+            Paths of the media files to archive
+        """
+        if unique_paths is None:
+            unique_paths = file_manager.get_file_list(str(unique_folder))
+        
+        extensions = file_manager.EXPORT_EXTENSIONS
+        media = [str(p) for p in unique_paths if os.path.splitext(p)[1].lower() in extensions]
+        
+        skipped = len(unique_paths) - len(media)
+        if skipped:
+            self.logger.log_info(f"Skipping {skipped} non-media files in export")
+        
+        return media
     
-    def _view_logs(self):
+    def _write_zip(self, file_manager, unique_folder: Path, zip_path: str, settings: Dict[str, Any],
+                   unique_paths: Optional[list], max_workers: int = 1) -> Optional[str]:
+        """Write a ZIP archive, deflating across max_workers processes and storing compressed media."""
+        import zipfile
+        
+        # Already-compressed media gains nothing from DEFLATE, store it as-is
+        # unless the user picked a non-default compression level
+        compression = zipfile.ZIP_DEFLATED
+        if (settings['compression_level'] == SettingsTab.DEFAULT_SETTINGS['compression_level']
+                and file_manager.is_precompressed_folder(str(unique_folder), file_paths=unique_paths)):
+            self.logger.log_info("Detected media-heavy export; using STORED")
+            compression = zipfile.ZIP_STORED
+        
+        # Post at most one status line per percent so the event queue stays small
+        last_percent = -1
+        
+        def report(done: int, total: int):
+            nonlocal last_percent
+            percent = done * 100 // total
+            if percent != last_percent:
+                last_percent = percent
+                self._post_event('status', f"Exporting unique photos to ZIP... {percent}% ({done}/{total})")
+        
+        return file_manager.export_to_zip(
+            str(unique_folder),
+            zip_path,
+            compression_level=settings['compression_level'],
+            compression=compression,
+            file_paths=unique_paths,
+            max_workers=max_workers,
+            progress_callback=report
+        )
+    
+    def _export_finished(self, success: bool, message: str):
+        """Handle archive export completion on main thread."""
+        with self._batch_ui():
+            self._busy.set(False)
+            self.export_button.configure(state='normal')
+            
+            if success:
+                self._set_status("Export completed")
+                self.frame.after_idle(messagebox.showinfo, "Export Complete", message)
+            else:
+                self._set_status("Export failed")
+                self.frame.after_idle(messagebox.showerror, "Export Failed", message)
+    
+    def _view_logs(self, event=None):
         """Open the log file."""
+        log_path = self.logger.get_log_file_path()
+        
+        # Opening the viewer may block on disk or process spawn, so keep it off the Tk thread
+        self._log_thread = threading.Thread(
+            target=self._open_log_file,
+            args=(log_path,),
+            daemon=True
+        )
+        self._log_thread.start()
+        self._watch_workers()
+    
+    def _open_log_file(self, log_path: str):
+        """Open the log file with the default application in a background thread."""
         try:
-            log_path = self.logger.get_log_file_path()
-            
             if os.path.exists(log_path):
                 # Try to open with default application
                 if os.name == 'nt':  # Windows
                     os.startfile(log_path)
-                elif os.name == 'posix':  # macOS/Linux
-                    os.system(f'open "{log_path}"' if os.uname().sysname == 'Darwin' else f'xdg-open "{log_path}"')
+                else:  # macOS/Linux
+                    subprocess.Popen(
+                        [_OPEN_CMD, str(log_path)],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        close_fds=True
+                    )
             else:
-                messagebox.showwarning("No Log File", "No log file found. Start processing to generate logs.")
+                self._post_event(
+                    'warning',
+                    "No Log File", "No log file found. Start processing to generate logs."
+                )
                 
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to open log file:\n{str(e)}")
+            self._post_event('error', "Error", f"Failed to open log file:\n{str(e)}")
     
-    def _show_help(self):
+    def _show_help(self, event=None):
         """Show help documentation."""
-        help_text = """
-Picture Finder - Help
-
-1. SELECT FOLDER: Choose the folder containing your photos
-
-2. CHOOSE ACTION:
-   • Copy: Keep original files, copy unique photos to 'unique_photos' folder
-   • Move: Move unique photos to 'unique_photos' folder (originals are removed)
-
-3. PERFORMANCE MODE:
-   • Low: Uses 1 CPU core and minimal RAM (slower, but system-friendly)
-   • Medium: Uses 2 CPU cores and moderate RAM (balanced)
-   • High: Uses 4 CPU cores and high RAM (fastest, but resource-intensive)
-
-4. SETTINGS TAB:
-   • Similarity Threshold: How similar images must be (1=strict, 20=lenient)
-   • Batch Size: Number of files processed at once
-   • Hash Algorithm: Method for detecting duplicates
-   • Recursive Scan: Include subfolders
-
-5. OUTPUT:
-   • Duplicates are moved to 'duplicates' folder
-   • Unique photos go to 'unique_photos' folder
-   • Videos are moved to 'videos' folder
-   • Detailed logs are created for each run
-
-Tips:
-• Start with default settings for most use cases
-• Use lower similarity threshold for stricter duplicate detection
-• Enable recursive scan to process subfolders
-• Check logs for detailed processing information
-        """
+        # Reuse the help window if it was already built
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
         
         # Create help window
         help_window = tk.Toplevel(self.frame.winfo_toplevel())
         help_window.title("Picture Finder - Help")
-        help_window.geometry("600x500")
         help_window.transient(self.frame.winfo_toplevel())
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        self._help_window = help_window
         
-        # Help text widget with scrollbar
-        text_frame = ttk.Frame(help_window)
-        text_frame.pack(fill='both', expand=True, padx=20, pady=20)
-        
-        text_widget = tk.Text(
-            text_frame,
-            wrap='word',
-            font=('Helvetica', 10),
-            background='white',
-            foreground='black'
+        # Static text renders as a wrapped label; no Text widget layout needed
+        help_label = ttk.Label(
+            help_window,
+            text=HELP_TEXT,
+            wraplength=560,
+            justify='left',
+            font=('Helvetica', 10)
         )
-        
-        scrollbar = ttk.Scrollbar(text_frame, orient='vertical', command=text_widget.yview)
-        text_widget.configure(yscrollcommand=scrollbar.set)
-        
-        text_widget.insert('1.0', help_text)
-        text_widget.configure(state='disabled')
-        
-        text_widget.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
+        help_label.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Close button
         close_button = ttk.Button(
             help_window,
             text="Close",
-            command=help_window.destroy
+            command=help_window.withdraw
         )
         close_button.pack(pady=(0, 20))
     
+    def _set_status(self, text: str):
+        """Queue a status line update for the next display flush."""
+        self._pending_status = text
+        self._schedule_display_flush()
+    
     def _update_stats_display(self, stats_text: str):
-        """Update the statistics display."""
-        self.stats_text.configure(state='normal')
-        self.stats_text.delete('1.0', tk.END)
-        self.stats_text.insert('1.0', stats_text)
-        self.stats_text.configure(state='disabled')
+        """Queue a statistics display update for the next display flush."""
+        self._pending_stats = stats_text
+        self._schedule_display_flush()
+    
+    @contextmanager
+    def _batch_ui(self):
+        """Group display updates made in the block into a single flush on exit."""
+        self._in_batch = True
+        try:
+            yield
+        finally:
+            self._in_batch = False
+            self._flush_display()
+    
+    def _schedule_display_flush(self):
+        """Schedule at most one display flush per 50ms window."""
+        if self._in_batch:
+            return  # Flushed when the batch ends
+        if not self._display_flush_scheduled:
+            self._display_flush_scheduled = True
+            self.frame.after(50, self._flush_display)
+    
+    def _flush_display(self):
+        """Apply the latest pending status and statistics updates."""
+        self._display_flush_scheduled = False
+        
+        status, self._pending_status = self._pending_status, None
+        if status is not None:
+            self.status_text.set(status)
+        
+        stats_text, self._pending_stats = self._pending_stats, None
+        if stats_text is not None:
+            self._write_stats(stats_text)
+    
+    def _write_stats(self, stats_text: str):
+        """Write statistics text, touching only the lines that changed."""
+        if stats_text == self._last_stats:
+            return
+        self._last_stats = stats_text
+        
+        lines = stats_text.split('\n')[:self.STATS_LINES]
+        lines += [''] * (self.STATS_LINES - len(lines))
+        
+        for i, line in enumerate(lines):
+            if line != self._stats_lines[i]:
+                self.stats_canvas.itemconfigure(f'stat{i}', text=line)
+        
+        self._stats_lines = lines
 
 
 class PictureFinderGUI:
@@ -1035,6 +1646,18 @@ class PictureFinderGUI:
         self.root = root
         self.logger = get_logger()
         
+        # Accessibility help dialog, built on first use
+        self._accessibility_window: Optional[tk.Toplevel] = None
+        
+        # Time of the last Ctrl+R folder dialog, used to drop key-repeat events
+        self._last_browse_ts = 0.0
+        
+        # Created in _create_gui; shortcut handlers check these against None
+        self.theme: Optional[PictureFinderTheme] = None
+        self.notebook: Optional[ttk.Notebook] = None
+        self.settings_tab: Optional[SettingsTab] = None
+        self.main_tab: Optional[MainTab] = None
+        
         self._setup_window()
         self.theme = PictureFinderTheme(root)
         self.theme.apply_theme()
@@ -1075,16 +1698,20 @@ class PictureFinderGUI:
         
         # Main tab frame
         main_frame = ttk.Frame(self.notebook, style='PF.TFrame')
-        self.notebook.add(main_frame, text=f"{ICONS['image']} Main")
+        self.notebook.add(main_frame, text=_MAIN_TAB_LABEL)
         
         # Settings tab frame
         settings_frame = ttk.Frame(self.notebook, style='PF.TFrame')
-        self.notebook.add(settings_frame, text=f"{ICONS['settings']} Settings")
+        self.notebook.add(settings_frame, text=_SETTINGS_TAB_LABEL)
         
         # Create tab instances
         self.settings_tab = SettingsTab(settings_frame, self.theme)
         self.main_tab = MainTab(main_frame, self.theme, self.settings_tab)
         
+        # Build the settings widgets only once the tab is first selected
+        self._settings_frame = settings_frame
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        
         # Status bar
         self.status_bar = ttk.Label(
             self.root,
@@ -1099,116 +1726,129 @@ class PictureFinderGUI:
         add_tooltip(main_frame, "Main processing interface")
         add_tooltip(settings_frame, "Configure detection and processing settings")
     
+    def _on_tab_changed(self, event=None):
+        """Handle notebook tab selection."""
+        if self.notebook.select() == str(self._settings_frame):
+            self.settings_tab._ensure_built()
+    
     def _setup_keyboard_shortcuts(self):
         """Set up enhanced keyboard shortcuts for accessibility."""
-        # File operations
-        self.root.bind('<Control-o>', lambda e: self.main_tab._browse_folder())
-        self.root.bind('<Control-s>', lambda e: self._save_settings())
-        self.root.bind('<Control-e>', lambda e: self.main_tab._export_zip())
-        
-        # Processing controls
-        self.root.bind('<F5>', lambda e: self.main_tab._start_processing())
-        self.root.bind('<Escape>', lambda e: self._cancel_processing())
-        
-        # Navigation and help
-        self.root.bind('<F1>', lambda e: self.main_tab._show_help())
-        self.root.bind('<Control-h>', lambda e: self._show_accessibility_help())
-        self.root.bind('<Control-l>', lambda e: self.main_tab._view_logs())
-        
-        # Tab navigation
-        self.root.bind('<Control-Tab>', lambda e: self._next_tab())
-        self.root.bind('<Control-Shift-Tab>', lambda e: self._previous_tab())
-        
-        # Accessibility toggles
-        self.root.bind('<Control-Alt-h>', lambda e: self._toggle_high_contrast())
-        self.root.bind('<Control-Alt-t>', lambda e: self._toggle_tooltips())
+        # Bound methods already take the event, so no wrapper closures are needed
+        self._accel = {
+            # File operations
+            '<Control-o>': self.main_tab._browse_folder,
+            '<Control-s>': self._save_settings,
+            '<Control-e>': self.main_tab._export_zip,
+            
+            # Processing controls
+            '<F5>': self.main_tab._start_processing,
+            '<Escape>': self._cancel_processing,
+            
+            # Navigation and help
+            '<F1>': self.main_tab._show_help,
+            '<Control-h>': self._show_accessibility_help,
+            '<Control-l>': self.main_tab._view_logs,
+            
+            # Tab navigation
+            '<Control-Tab>': self._next_tab,
+            '<Control-Shift-Tab>': self._previous_tab,
+            
+            # Accessibility toggles
+            '<Control-Alt-h>': self._toggle_high_contrast,
+            '<Control-Alt-t>': self._toggle_tooltips,
+            
+            # Quick actions
+            '<Control-r>': self._refresh_folder,
+            '<Control-q>': self._on_closing,
+        }
         
-        # Quick actions
-        self.root.bind('<Control-r>', lambda e: self._refresh_folder())
-        self.root.bind('<Control-q>', lambda e: self._on_closing())
+        for sequence, handler in self._accel.items():
+            self.root.bind(sequence, handler)
     
-    def _save_settings(self):
+    def _save_settings(self, event=None):
         """Save current settings."""
-        if hasattr(self, 'settings_tab'):
+        if self.settings_tab is not None:
             self.settings_tab._save_settings()
     
-    def _cancel_processing(self):
+    def _cancel_processing(self, event=None):
         """Cancel current processing."""
-        if hasattr(self.main_tab, 'processor') and self.main_tab.processor:
+        if self.main_tab is not None and self.main_tab.processor is not None:
             self.main_tab.processor.cancel_processing()
     
-    def _show_accessibility_help(self):
+    def _show_accessibility_help(self, event=None):
         """Show accessibility help dialog."""
-        help_text = """
-Accessibility Keyboard Shortcuts:
-
-File Operations:
-• Ctrl+O: Browse for folder
-• Ctrl+S: Save settings
-• Ctrl+E: Export results to ZIP
-
-Processing:
-• F5: Start processing
-• Escape: Cancel processing
-
-Navigation:
-• F1: Show help
-• Ctrl+H: Show this accessibility help
-• Ctrl+L: View logs
-• Ctrl+Tab: Next tab
-• Ctrl+Shift+Tab: Previous tab
-
-Accessibility:
-• Ctrl+Alt+H: Toggle high contrast mode
-• Ctrl+Alt+T: Toggle enhanced tooltips
-
-Quick Actions:
-• Ctrl+R: Refresh folder
-• Ctrl+Q: Quit application
-
-All buttons and controls are keyboard accessible using Tab/Shift+Tab navigation.
-"""
-        messagebox.showinfo("Accessibility Help", help_text)
+        # Reuse the dialog if it was already built
+        if self._accessibility_window is not None and self._accessibility_window.winfo_exists():
+            self._accessibility_window.deiconify()
+            self._accessibility_window.lift()
+            return
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Accessibility Help")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+        self._accessibility_window = dialog
+        
+        ttk.Label(
+            dialog,
+            text=ACCESSIBILITY_HELP_TEXT,
+            justify='left',
+            font=('Helvetica', 10)
+        ).pack(padx=20, pady=20)
+        
+        ttk.Button(
+            dialog,
+            text="Close",
+            command=dialog.withdraw
+        ).pack(pady=(0, 20))
     
-    def _next_tab(self):
+    def _next_tab(self, event=None):
         """Navigate to next tab."""
-        if hasattr(self, 'notebook'):
+        if self.notebook is not None:
             current = self.notebook.index('current')
             total = self.notebook.index('end')
             next_tab = (current + 1) % total
             self.notebook.select(next_tab)
     
-    def _previous_tab(self):
+    def _previous_tab(self, event=None):
         """Navigate to previous tab."""
-        if hasattr(self, 'notebook'):
+        if self.notebook is not None:
             current = self.notebook.index('current')
             total = self.notebook.index('end')
             prev_tab = (current - 1) % total
             self.notebook.select(prev_tab)
     
-    def _toggle_high_contrast(self):
+    def _toggle_high_contrast(self, event=None):
         """Toggle high contrast mode."""
-        if hasattr(self, 'theme'):
+        if self.theme is not None:
             self.theme.toggle_high_contrast()
     
-    def _toggle_tooltips(self):
+    def _toggle_tooltips(self, event=None):
         """Toggle enhanced tooltips."""
-        if hasattr(self, 'theme'):
+        if self.theme is not None:
             self.theme.toggle_enhanced_tooltips()
     
-    def _refresh_folder(self):
+    def _refresh_folder(self, event=None):
         """Refresh current folder selection."""
-        if hasattr(self.main_tab, '_browse_folder'):
+        if time.monotonic() - self._last_browse_ts <= 0.25:
+            return
+        
+        self._last_browse_ts = time.monotonic()
+        if self.main_tab is not None:
             self.main_tab._browse_folder()
+            # Repeats queued while the dialog was open are dropped as well
+            self._last_browse_ts = time.monotonic()
     
-    def _on_closing(self):
+    def _on_closing(self, event=None):
         """Handle application closing."""
         # Cancel any ongoing processing
-        if hasattr(self.main_tab, 'processor') and self.main_tab.processor:
+        thread = self.main_tab.processing_thread
+        if thread is not None and thread.is_alive():
             self.main_tab.processor.cancel_processing()
         
         # Close progress dialog if open
-        if hasattr(self.main_tab, 'progress_dialog') and self.main_tab.progress_dialog:
+        if self.main_tab.progress_dialog is not None:
             self.main_tab.progress_dialog.close()
         
         self.logger.log_info("Picture Finder GUI closing")
@@ -11,13 +11,126 @@ except ImportError:
 
 import tkinter as tk
 from tkinter import ttk
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+def _style_table(c: Mapping[str, str]) -> List[Tuple[str, Dict[str, Any], Optional[Dict[str, list]]]]:
+    """
+    Build the ttk style definitions for a color palette.
+    
+    Args:
+        c: Color palette (see PictureFinderTheme.COLORS)
+        
+    Returns:
+        List of (style name, configure options, state map or None)
+    """
+    # Most-used colors, looked up once
+    bg, bg2, accent = c['primary_bg'], c['secondary_bg'], c['primary_accent']
+    fg, fg2 = c['text_primary'], c['text_secondary']
+    
+    bold_button = dict(borderwidth=0, focuscolor='none', padding=(10, 5), font=('Helvetica', 10, 'bold'))
+    indicator_map = {
+        'background': [('active', bg)],
+        'indicatorcolor': [('selected', accent), ('!selected', bg2)]
+    }
+    
+    return [
+        # Frames
+        ('PF.TFrame', dict(background=bg, borderwidth=0), None),
+        ('Card.TFrame', dict(background=bg2, relief='raised', borderwidth=1), None),
+        ('Header.TFrame', dict(background=accent, borderwidth=0), None),
+        
+        # Buttons
+        ('PF.TButton',
+         dict(background=accent, foreground=fg, **bold_button),
+         {'background': [('active', c['hover']),
+                         ('pressed', c['secondary_accent']),
+                         ('disabled', c['disabled'])],
+          'foreground': [('disabled', fg)]}),
+        ('Secondary.TButton',
+         dict(background=bg2, foreground=fg2, borderwidth=1,
+              bordercolor=accent, focuscolor='none', padding=(8, 4),
+              font=('Helvetica', 9)),
+         {'background': [('active', bg), ('pressed', accent)],
+          'foreground': [('pressed', fg)]}),
+        ('Success.TButton', dict(background=c['success'], foreground=fg, **bold_button), None),
+        ('Warning.TButton', dict(background=c['warning'], foreground=c['text_dark'], **bold_button), None),
+        ('Error.TButton', dict(background=c['error'], foreground=fg, **bold_button), None),
+        
+        # Labels
+        ('PF.TLabel',
+         dict(background=bg, foreground=fg2, font=('Helvetica', 10)), None),
+        ('Header.TLabel',
+         dict(background=accent, foreground=fg,
+              font=('Helvetica', 12, 'bold'), padding=(10, 5)), None),
+        ('Status.TLabel',
+         dict(background=bg, foreground=c['text_dark'],
+              font=('Helvetica', 9), padding=(5, 2)), None),
+        ('Success.TLabel',
+         dict(background=c['success'], foreground=fg,
+              font=('Helvetica', 9, 'bold'), padding=(5, 2)), None),
+        ('Error.TLabel',
+         dict(background=c['error'], foreground=fg,
+              font=('Helvetica', 9, 'bold'), padding=(5, 2)), None),
+        
+        # Entries
+        ('PF.TEntry',
+         dict(fieldbackground=bg2, foreground=c['text_dark'], borderwidth=1,
+              insertcolor=accent, font=('Helvetica', 10)),
+         {'focuscolor': [('focus', accent)],
+          'bordercolor': [('focus', accent)]}),
+        
+        # Checkboxes and radio buttons
+        ('PF.TCheckbutton',
+         dict(background=bg, foreground=fg2, focuscolor='none',
+              font=('Helvetica', 10)),
+         indicator_map),
+        ('PF.TRadiobutton',
+         dict(background=bg, foreground=fg2, focuscolor='none',
+              font=('Helvetica', 10)),
+         indicator_map),
+        
+        # Scales and progress bars
+        ('PF.TScale',
+         dict(background=bg, troughcolor=bg2, slidercolor=accent,
+              borderwidth=0, lightcolor=c['hover'], darkcolor=c['secondary_accent']),
+         {'slidercolor': [('active', c['hover']), ('pressed', c['secondary_accent'])]}),
+        ('PF.TProgressbar',
+         dict(background=accent, troughcolor=bg2, borderwidth=1,
+              lightcolor=c['hover'], darkcolor=c['secondary_accent']), None),
+        
+        # Notebooks
+        ('PF.TNotebook', dict(background=bg, borderwidth=0), None),
+        ('PF.TNotebook.Tab',
+         dict(background=bg2, foreground=fg2, padding=[20, 10],
+              font=('Helvetica', 10, 'bold'), borderwidth=1),
+         {'background': [('selected', accent), ('active', c['hover'])],
+          'foreground': [('selected', fg), ('active', fg)]}),
+        
+        # Treeviews
+        ('PF.Treeview',
+         dict(background=bg2, foreground=c['text_dark'], fieldbackground=bg2,
+              borderwidth=1, font=('Helvetica', 9)),
+         {'background': [('selected', accent)],
+          'foreground': [('selected', fg)]}),
+        ('PF.Treeview.Heading',
+         dict(background=accent, foreground=fg, borderwidth=1,
+              font=('Helvetica', 10, 'bold')), None),
+        
+        # Scrollbars
+        ('PF.TScrollbar',
+         dict(background=bg2, troughcolor=bg, borderwidth=0,
+              arrowcolor=accent, darkcolor=c['secondary_accent'], lightcolor=c['hover']),
+         None),
+    ]
 
 
 class PictureFinderTheme:
     """Custom theme manager for Picture Finder with teal/white color scheme."""
     
-    # Color palette
-    COLORS = {
+    # Color palette (read-only; swap the whole mapping to change themes)
+    COLORS = MappingProxyType({
         'primary_bg': '#ADD8E6',      # Light blue background
         'secondary_bg': '#E0F6FF',    # Very light blue
         'primary_accent': '#008080',   # Teal accent
@@ -31,7 +144,7 @@ class PictureFinderTheme:
         'disabled': '#6C757D',         # Gray for disabled elements
         'border': '#B0B0B0',           # Light gray borders
         'hover': '#20B2AA'             # Light sea green for hover
-    }
+    })
     
     def __init__(self, root: tk.Tk):
         """
@@ -46,19 +159,17 @@ class PictureFinderTheme:
         
         if TTKTHEMES_AVAILABLE:
             self.style = ThemedStyle(root)
-            # Try to use a modern theme as base
-            try:
-                self.style.set_theme('equilux')
-            except:
-                try:
-                    self.style.set_theme('arc')
-                except:
-                    pass  # Fall back to default
+            # Use the first available modern theme as base, else keep the default
+            available = set(self.style.theme_names())
+            for preferred in ('equilux', 'arc', 'clam'):
+                if preferred in available:
+                    self.style.set_theme(preferred)
+                    break
         else:
             self.style = ttk.Style()
         
         # High contrast colors
-        self.HIGH_CONTRAST_COLORS = {
+        self.HIGH_CONTRAST_COLORS = MappingProxyType({
             'primary_bg': '#000000',      # Black background
             'secondary_bg': '#FFFFFF',    # White background
             'primary_accent': '#FFFF00',   # Yellow accent
@@ -72,337 +183,16 @@ class PictureFinderTheme:
             'disabled': '#808080',         # Gray for disabled elements
             'border': '#FFFFFF',           # White borders
             'hover': '#FFFF00'             # Yellow for hover
-        }
+        })
     
     def apply_theme(self):
         """Apply the complete Picture Finder theme."""
-        self._configure_window()
-        self._configure_frames()
-        self._configure_buttons()
-        self._configure_labels()
-        self._configure_entries()
-        self._configure_checkboxes_radios()
-        self._configure_scales()
-        self._configure_progressbars()
-        self._configure_notebooks()
-        self._configure_treeviews()
-        self._configure_scrollbars()
-        self._configure_tooltips()
-    
-    def _configure_window(self):
-        """Configure main window appearance."""
         self.root.configure(bg=self.COLORS['primary_bg'])
-    
-    def _configure_frames(self):
-        """Configure frame styles."""
-        # Main frame style
-        self.style.configure(
-            'PF.TFrame',
-            background=self.COLORS['primary_bg'],
-            borderwidth=0
-        )
-        
-        # Card-like frames for sections
-        self.style.configure(
-            'Card.TFrame',
-            background=self.COLORS['secondary_bg'],
-            relief='raised',
-            borderwidth=1
-        )
-        
-        # Header frames
-        self.style.configure(
-            'Header.TFrame',
-            background=self.COLORS['primary_accent'],
-            borderwidth=0
-        )
-    
-    def _configure_buttons(self):
-        """Configure button styles with hover effects."""
-        # Primary buttons
-        self.style.configure(
-            'PF.TButton',
-            background=self.COLORS['primary_accent'],
-            foreground=self.COLORS['text_primary'],
-            borderwidth=0,
-            focuscolor='none',
-            padding=(10, 5),
-            font=('Helvetica', 10, 'bold')
-        )
-        
-        self.style.map(
-            'PF.TButton',
-            background=[
-                ('active', self.COLORS['hover']),
-                ('pressed', self.COLORS['secondary_accent']),
-                ('disabled', self.COLORS['disabled'])
-            ],
-            foreground=[
-                ('disabled', self.COLORS['text_primary'])
-            ]
-        )
-        
-        # Secondary buttons
-        self.style.configure(
-            'Secondary.TButton',
-            background=self.COLORS['secondary_bg'],
-            foreground=self.COLORS['text_secondary'],
-            borderwidth=1,
-            bordercolor=self.COLORS['primary_accent'],
-            focuscolor='none',
-            padding=(8, 4),
-            font=('Helvetica', 9)
-        )
-        
-        self.style.map(
-            'Secondary.TButton',
-            background=[
-                ('active', self.COLORS['primary_bg']),
-                ('pressed', self.COLORS['primary_accent'])
-            ],
-            foreground=[
-                ('pressed', self.COLORS['text_primary'])
-            ]
-        )
-        
-        # Success button
-        self.style.configure(
-            'Success.TButton',
-            background=self.COLORS['success'],
-            foreground=self.COLORS['text_primary'],
-            borderwidth=0,
-            focuscolor='none',
-            padding=(10, 5),
-            font=('Helvetica', 10, 'bold')
-        )
         
-        # Warning button
-        self.style.configure(
-            'Warning.TButton',
-            background=self.COLORS['warning'],
-            foreground=self.COLORS['text_dark'],
-            borderwidth=0,
-            focuscolor='none',
-            padding=(10, 5),
-            font=('Helvetica', 10, 'bold')
-        )
-        
-        # Error button
-        self.style.configure(
-            'Error.TButton',
-            background=self.COLORS['error'],
-            foreground=self.COLORS['text_primary'],
-            borderwidth=0,
-            focuscolor='none',
-            padding=(10, 5),
-            font=('Helvetica', 10, 'bold')
-        )
-    
-    def _configure_labels(self):
-        """Configure label styles."""
-        # Standard labels
-        self.style.configure(
-            'PF.TLabel',
-            background=self.COLORS['primary_bg'],
-            foreground=self.COLORS['text_secondary'],
-            font=('Helvetica', 10)
-        )
-        
-        # Header labels
-        self.style.configure(
-            'Header.TLabel',
-            background=self.COLORS['primary_accent'],
-            foreground=self.COLORS['text_primary'],
-            font=('Helvetica', 12, 'bold'),
-            padding=(10, 5)
-        )
-        
-        # Status labels
-        self.style.configure(
-            'Status.TLabel',
-            background=self.COLORS['primary_bg'],
-            foreground=self.COLORS['text_dark'],
-            font=('Helvetica', 9),
-            padding=(5, 2)
-        )
-        
-        # Success/Error labels
-        self.style.configure(
-            'Success.TLabel',
-            background=self.COLORS['success'],
-            foreground=self.COLORS['text_primary'],
-            font=('Helvetica', 9, 'bold'),
-            padding=(5, 2)
-        )
-        
-        self.style.configure(
-            'Error.TLabel',
-            background=self.COLORS['error'],
-            foreground=self.COLORS['text_primary'],
-            font=('Helvetica', 9, 'bold'),
-            padding=(5, 2)
-        )
-    
-    def _configure_entries(self):
-        """Configure entry field styles."""
-        self.style.configure(
-            'PF.TEntry',
-            fieldbackground=self.COLORS['secondary_bg'],
-            foreground=self.COLORS['text_dark'],
-            borderwidth=1,
-            insertcolor=self.COLORS['primary_accent'],
-            font=('Helvetica', 10)
-        )
-        
-        self.style.map(
-            'PF.TEntry',
-            focuscolor=[('focus', self.COLORS['primary_accent'])],
-            bordercolor=[('focus', self.COLORS['primary_accent'])]
-        )
-    
-    def _configure_checkboxes_radios(self):
-        """Configure checkbox and radio button styles."""
-        # Checkboxes
-        self.style.configure(
-            'PF.TCheckbutton',
-            background=self.COLORS['primary_bg'],
-            foreground=self.COLORS['text_secondary'],
-            focuscolor='none',
-            font=('Helvetica', 10)
-        )
-        
-        self.style.map(
-            'PF.TCheckbutton',
-            background=[('active', self.COLORS['primary_bg'])],
-            indicatorcolor=[
-                ('selected', self.COLORS['primary_accent']),
-                ('!selected', self.COLORS['secondary_bg'])
-            ]
-        )
-        
-        # Radio buttons
-        self.style.configure(
-            'PF.TRadiobutton',
-            background=self.COLORS['primary_bg'],
-            foreground=self.COLORS['text_secondary'],
-            focuscolor='none',
-            font=('Helvetica', 10)
-        )
-        
-        self.style.map(
-            'PF.TRadiobutton',
-            background=[('active', self.COLORS['primary_bg'])],
-            indicatorcolor=[
-                ('selected', self.COLORS['primary_accent']),
-                ('!selected', self.COLORS['secondary_bg'])
-            ]
-        )
-    
-    def _configure_scales(self):
-        """Configure slider/scale styles."""
-        self.style.configure(
-            'PF.TScale',
-            background=self.COLORS['primary_bg'],
-            troughcolor=self.COLORS['secondary_bg'],
-            slidercolor=self.COLORS['primary_accent'],
-            borderwidth=0,
-            lightcolor=self.COLORS['hover'],
-            darkcolor=self.COLORS['secondary_accent']
-        )
-        
-        self.style.map(
-            'PF.TScale',
-            slidercolor=[
-                ('active', self.COLORS['hover']),
-                ('pressed', self.COLORS['secondary_accent'])
-            ]
-        )
-    
-    def _configure_progressbars(self):
-        """Configure progress bar styles."""
-        self.style.configure(
-            'PF.TProgressbar',
-            background=self.COLORS['primary_accent'],
-            troughcolor=self.COLORS['secondary_bg'],
-            borderwidth=1,
-            lightcolor=self.COLORS['hover'],
-            darkcolor=self.COLORS['secondary_accent']
-        )
-    
-    def _configure_notebooks(self):
-        """Configure notebook (tab) styles."""
-        self.style.configure(
-            'PF.TNotebook',
-            background=self.COLORS['primary_bg'],
-            borderwidth=0
-        )
-        
-        self.style.configure(
-            'PF.TNotebook.Tab',
-            background=self.COLORS['secondary_bg'],
-            foreground=self.COLORS['text_secondary'],
-            padding=[20, 10],
-            font=('Helvetica', 10, 'bold'),
-            borderwidth=1
-        )
-        
-        self.style.map(
-            'PF.TNotebook.Tab',
-            background=[
-                ('selected', self.COLORS['primary_accent']),
-                ('active', self.COLORS['hover'])
-            ],
-            foreground=[
-                ('selected', self.COLORS['text_primary']),
-                ('active', self.COLORS['text_primary'])
-            ]
-        )
-    
-    def _configure_treeviews(self):
-        """Configure treeview (list) styles."""
-        self.style.configure(
-            'PF.Treeview',
-            background=self.COLORS['secondary_bg'],
-            foreground=self.COLORS['text_dark'],
-            fieldbackground=self.COLORS['secondary_bg'],
-            borderwidth=1,
-            font=('Helvetica', 9)
-        )
-        
-        self.style.configure(
-            'PF.Treeview.Heading',
-            background=self.COLORS['primary_accent'],
-            foreground=self.COLORS['text_primary'],
-            borderwidth=1,
-            font=('Helvetica', 10, 'bold')
-        )
-        
-        self.style.map(
-            'PF.Treeview',
-            background=[
-                ('selected', self.COLORS['primary_accent'])
-            ],
-            foreground=[
-                ('selected', self.COLORS['text_primary'])
-            ]
-        )
-    
-    def _configure_scrollbars(self):
-        """Configure scrollbar styles."""
-        self.style.configure(
-            'PF.TScrollbar',
-            background=self.COLORS['secondary_bg'],
-            troughcolor=self.COLORS['primary_bg'],
-            borderwidth=0,
-            arrowcolor=self.COLORS['primary_accent'],
-            darkcolor=self.COLORS['secondary_accent'],
-            lightcolor=self.COLORS['hover']
-        )
-    
-    def _configure_tooltips(self):
-        """Configure tooltip styles."""
-        # Note: Tooltips are typically handled separately as they're not standard ttk widgets
-        pass
+        for name, options, mapping in _style_table(self.COLORS):
+            self.style.configure(name, **options)
+            if mapping:
+                self.style.map(name, **mapping)
     
     def get_color(self, color_name: str) -> str:
         """Get color value by name."""
@@ -455,6 +245,10 @@ def apply_styles(style = None, root: tk.Tk = None) -> PictureFinderTheme:
 class ToolTip:
     """Enhanced tooltip widget for accessibility."""
     
+    # One tooltip window shared by every ToolTip, created on first show
+    _shared_window: Optional[tk.Toplevel] = None
+    _shared_label: Optional[tk.Label] = None
+    
     def __init__(self, widget, text='', delay=500, wraplength=180):
         """
         Create a tooltip for a widget.
@@ -507,29 +301,41 @@ class ToolTip:
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 20
         
-        # Create tooltip window
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
-        
-        # Configure tooltip appearance
-        label = tk.Label(
-            self.tooltip_window,
-            text=self.text,
-            justify='left',
-            background='#FFFFE0',
-            foreground='#000000',
-            relief='solid',
-            borderwidth=1,
-            font=('Helvetica', 9),
-            wraplength=self.wraplength
-        )
-        label.pack(ipadx=5, ipady=3)
+        # Reuse the shared window, only moving it and replacing its text
+        window = self._get_shared_window(self.widget)
+        ToolTip._shared_label.configure(text=self.text, wraplength=self.wraplength)
+        window.wm_geometry(f"+{x}+{y}")
+        window.deiconify()
+        window.lift()
+        self.tooltip_window = window
+    
+    @classmethod
+    def _get_shared_window(cls, widget) -> tk.Toplevel:
+        """Return the shared tooltip window, creating it under the root window if needed."""
+        if cls._shared_window is None or not cls._shared_window.winfo_exists():
+            cls._shared_window = tk.Toplevel(widget._root())
+            cls._shared_window.wm_overrideredirect(True)
+            cls._shared_window.withdraw()
+            
+            # Configure tooltip appearance
+            cls._shared_label = tk.Label(
+                cls._shared_window,
+                justify='left',
+                background='#FFFFE0',
+                foreground='#000000',
+                relief='solid',
+                borderwidth=1,
+                font=('Helvetica', 9)
+            )
+            cls._shared_label.pack(ipadx=5, ipady=3)
+        
+        return cls._shared_window
     
     def hide_tooltip(self):
         """Hide the tooltip."""
         if self.tooltip_window:
-            self.tooltip_window.destroy()
+            if self.tooltip_window.winfo_exists():
+                self.tooltip_window.withdraw()
             self.tooltip_window = None
     
     def update_text(self, new_text: str):
@@ -580,6 +386,50 @@ def make_accessible(widget, label_text: str = None, description: str = None):
         pass  # Widget doesn't support takefocus
 
 
+def create_radio_group(parent, variable, options, command=None, side: str = 'top',
+                       style: str = 'PF.TRadiobutton', **pack_kwargs):
+    """
+    Create a frame holding one radiobutton per option.
+    
+    The buttons share one style and are packed together once all of them exist,
+    so the group gets a single geometry pass.
+    
+    Args:
+        parent: Parent widget
+        variable: Tk variable shared by the buttons
+        options: Sequence of (value, text) pairs
+        command: Optional command for every button
+        side: Pack side for the buttons ('top' or 'left')
+        style: Radiobutton style
+        **pack_kwargs: Additional pack arguments for each button
+        
+    Returns:
+        Tuple of (frame, list of radiobuttons)
+    """
+    frame = ttk.Frame(parent, style='PF.TFrame', padding=0)
+    
+    buttons = [
+        ttk.Radiobutton(
+            frame,
+            text=text,
+            variable=variable,
+            value=value,
+            style=style,
+            command=command
+        )
+        for value, text in options
+    ]
+    
+    for button in buttons:
+        button.pack(side=side, **pack_kwargs)
+    
+    return frame, buttons
+
+
+# Button labels keyed by (icon_char, text), built once per distinct pair
+_LABEL_CACHE: Dict[Tuple[Optional[str], str], str] = {}
+
+
 def create_icon_button(parent, text: str, command=None, icon_char: str = None, 
                       style: str = 'PF.TButton', **kwargs):
     """
@@ -596,9 +446,10 @@ def create_icon_button(parent, text: str, command=None, icon_char: str = None,
     Returns:
         Button widget
     """
-    button_text = text
-    if icon_char:
-        button_text = f"{icon_char} {text}"
+    key = (icon_char, text)
+    button_text = _LABEL_CACHE.get(key)
+    if button_text is None:
+        button_text = _LABEL_CACHE.setdefault(key, ' '.join((icon_char, text)) if icon_char else text)
     
     button = ttk.Button(
         parent,
@@ -8,72 +8,151 @@ Comprehensive test script for Picture Finder enhancements including:
 - Configuration management
 """
 
+import argparse
+import io
 import os
 import sys
-import time
 import tempfile
 import shutil
+import tarfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, Optional, Set, Tuple
+
+import numpy as np
+from PIL import Image, ImageColor
+
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, default=str).encode('utf-8')
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from core.image_processor import ImageProcessor, AdvancedPerformanceMonitor, ImageHasher
-from core.file_manager import FileManager
+from core.file_manager import FileManager, PY7ZR_AVAILABLE, RAW_ZIP_WRITES_SUPPORTED
 from core.config import get_config, ConfigManager
 from core.log_writer import get_logger
 
 
+# Held while zipfile.ZIP64_LIMIT is lowered, and by every other ZIP export,
+# since a writer opened under one limit fails if it is closed under another
+_ZIP64_LIMIT_LOCK = threading.Lock()
+
+# RGB values of the colors the tests use; others are resolved by PIL
+_RGB_TABLE = {'red': (255, 0, 0), 'blue': (0, 0, 255), 'navy': (0, 0, 128)}
+
+
+@lru_cache(maxsize=32)
+def _encode_image_bytes(size: tuple, color: str, suffix: str) -> bytes:
+    """Encode a solid-color test image once per (size, color, format)."""
+    rgb = _RGB_TABLE.get(color) or ImageColor.getrgb(color)
+    pixels = np.full((size[1], size[0], 3), rgb, dtype=np.uint8)
+    
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(
+        buffer,
+        format=Image.registered_extensions()[suffix],
+        quality=75,
+        optimize=False
+    )
+    return buffer.getvalue()
+
+
 class EnhancementTester:
     """Test suite for Picture Finder enhancements."""
     
-    def __init__(self):
-        """Initialize the test suite."""
-        self.logger = get_logger()
+    # Shared by every tester instance
+    logger = get_logger()
+    
+    # Hash algorithms exercised by the plugin test
+    ALGORITHMS = ('average', 'perceptual', 'difference', 'wavelet')
+    
+    # Folders created in every test's working directory
+    WORK_SUBDIRS = ('test_images', 'output')
+    
+    # Short names accepted by --only, mapped to their test methods
+    TESTS = {
+        'hash': 'test_hash_algorithm_plugins',
+        'perf': 'test_performance_monitoring',
+        'security': 'test_security_features',
+        'config': 'test_configuration_management',
+        'processing': 'test_enhanced_processing',
+        'zip': 'test_zip_round_trip',
+        'archive': 'test_archive_formats',
+    }
+    
+    def __init__(self, fail_fast: bool = False):
+        """
+        Initialize the test suite.
+        
+        Args:
+            fail_fast: Stop each test at its first recorded error
+        """
         self.temp_dir = None
         self.results = {}
+        self.fail_fast = fail_fast
     
-    def setup_test_environment(self):
-        """Set up temporary test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp(prefix='picture_finder_test_'))
-        self.logger.log_info(f"Test environment created: {self.temp_dir}")
+    def setup_test_environment(self) -> tempfile.TemporaryDirectory:
+        """
+        Set up temporary test environment.
         
-        # Create test directories
-        (self.temp_dir / "test_images").mkdir()
-        (self.temp_dir / "output").mkdir()
+        The directory is placed on a RAM-backed filesystem when one is available
+        (PICFINDER_TEST_RAMDIR, default /dev/shm) and is removed when the returned
+        TemporaryDirectory exits.
+        """
+        ram_dir = os.environ.get('PICFINDER_TEST_RAMDIR', '/dev/shm')
+        base_dir = ram_dir if os.path.isdir(ram_dir) and os.access(ram_dir, os.W_OK) else None
         
-        return self.temp_dir
+        temp_context = tempfile.TemporaryDirectory(prefix='picture_finder_test_', dir=base_dir)
+        self.temp_dir = Path(temp_context.name)
+        self.logger.log_info(f"Test environment created: {self.temp_dir}")
+        
+        return temp_context
     
-    def cleanup_test_environment(self):
-        """Clean up test environment."""
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-            self.logger.log_info("Test environment cleaned up")
+    def create_work_dir(self, name: str) -> Path:
+        """Create a test's own working directory with its input and output folders."""
+        work_dir = self.temp_dir / name
+        for sub_dir in self.WORK_SUBDIRS:
+            (work_dir / sub_dir).mkdir(parents=True, exist_ok=True)
+        return work_dir
     
     def create_test_image(self, path: Path, size: tuple = (100, 100), color: str = 'red'):
-        """Create a test image using PIL."""
+        """Create a test image, encoding each distinct image only once."""
         try:
-            from PIL import Image
-            
-            # Create a simple colored image
-            img = Image.new('RGB', size, color)
-            img.save(path)
+            path.write_bytes(_encode_image_bytes(size, color, path.suffix.lower()))
             return True
             
-        except ImportError:
-            # Fallback: create a small dummy file
-            with open(path, 'wb') as f:
-                f.write(b'\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00')
-            return True
         except Exception as e:
             self.logger.log_error(f"Failed to create test image: {str(e)}")
             return False
     
-    def test_hash_algorithm_plugins(self) -> Dict[str, Any]:
-        """Test hash algorithm plugin system."""
-        test_name = "Hash Algorithm Plugins"
+    @contextmanager
+    def _test(self, test_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Run the body of a test, collecting its results.
+        
+        Exceptions raised by the body are recorded as errors, and the test
+        passes if no errors were recorded.
+        
+        Args:
+            test_name: Display name of the test
+            
+        Yields:
+            Results dictionary for the body to fill in
+        """
         self.logger.log_info(f"Testing: {test_name}")
         
         results = {
@@ -84,38 +163,51 @@ class EnhancementTester:
         }
         
         try:
-            # Test each hash algorithm
-            algorithms = ['average', 'perceptual', 'difference', 'wavelet']
-            
+            yield results
+        except Exception as e:
+            results['errors'].append(f"Exception: {str(e)}")
+        
+        results['passed'] = not results['errors']
+    
+    def _should_stop(self, results: Dict[str, Any]) -> bool:
+        """Whether a test should skip its remaining checks under --fail-fast."""
+        return self.fail_fast and bool(results['errors'])
+    
+    def test_hash_algorithm_plugins(self, work_dir: Path) -> Dict[str, Any]:
+        """Test hash algorithm plugin system."""
+        with self._test("Hash Algorithm Plugins") as results:
             # Create test image
-            test_image = self.temp_dir / "test_images" / "test.jpg"
+            test_image = work_dir / "test_images" / "test.jpg"
             self.create_test_image(test_image)
             
-            for algorithm in algorithms:
-                hasher = ImageHasher(algorithm=algorithm)
-                
-                # Test hashing
-                hash_result, file_path, metadata = hasher.hash_file(str(test_image))
+            # One 'average' hasher serves both the batch and the cache checks
+            hasher = ImageHasher(algorithm='average')
+            
+            # Decode the image once and hash it with every algorithm
+            hashes, metadata = hasher.hash_batch(str(test_image), self.ALGORITHMS)
+            
+            for algorithm in self.ALGORITHMS:
+                hash_result = hashes.get(algorithm)
                 
                 if hash_result:
-                    results['details'][algorithm] = {
-                        'hash': hash_result,
-                        'processing_time': metadata.get('processing_time', 0),
-                        'from_cache': metadata.get('from_cache', False)
-                    }
+                    results['details'][algorithm] = {'hash': hash_result}
                 else:
                     results['errors'].append(f"Failed to hash with {algorithm}")
             
-            # Test cache functionality
-            hasher = ImageHasher(algorithm='average')
+            # The batch shares one decode, so only its total time is meaningful
+            results['details']['batch_processing_time'] = metadata['processing_time']
+            
+            if self._should_stop(results):
+                return results
             
+            # Test cache functionality
             # First hash (should be cache miss)
             hash1, _, meta1 = hasher.hash_file(str(test_image))
             
             # Second hash (should be cache hit)
             hash2, _, meta2 = hasher.hash_file(str(test_image))
             
-            if hash1 == hash2 and meta2.get('from_cache', False):
+            if hash1 == hash2 and meta2['from_cache']:
                 results['details']['cache_test'] = 'PASSED'
             else:
                 results['errors'].append("Cache functionality failed")
@@ -123,39 +215,26 @@ class EnhancementTester:
             # Test cache stats
             cache_stats = hasher.get_cache_stats()
             results['details']['cache_stats'] = cache_stats
-            
-            results['passed'] = len(results['errors']) == 0
-            
-        except Exception as e:
-            results['errors'].append(f"Exception: {str(e)}")
         
         return results
     
-    def test_performance_monitoring(self) -> Dict[str, Any]:
+    def test_performance_monitoring(self, work_dir: Path) -> Dict[str, Any]:
         """Test performance monitoring system."""
-        test_name = "Performance Monitoring"
-        self.logger.log_info(f"Testing: {test_name}")
-        
-        results = {
-            'test_name': test_name,
-            'passed': False,
-            'details': {},
-            'errors': []
-        }
-        
-        try:
+        with self._test("Performance Monitoring") as results:
             monitor = AdvancedPerformanceMonitor()
             
+            # Each phase appears to take 0.1s without actually sleeping
+            fake_times = iter([0.0, 0.0, 0.1, 0.1, 0.2, 0.2])
+            monitor._clock = lambda: next(fake_times)
+            
             # Test monitoring lifecycle
             monitor.start_monitoring()
             
             # Simulate processing phases
             monitor.start_phase('file_scanning')
-            time.sleep(0.1)  # Simulate work
             monitor.end_phase('file_scanning')
             
             monitor.start_phase('hash_calculation')
-            time.sleep(0.1)
             monitor.end_phase('hash_calculation')
             
             # Test metrics recording
@@ -174,35 +253,20 @@ class EnhancementTester:
             results['details']['phase_breakdown'] = summary['phase_breakdown']
             
             # Validate results
-            if summary['execution_time'] > 0 and summary['cache_hit_rate'] > 0:
-                results['passed'] = True
-            else:
+            if summary['execution_time'] <= 0 or summary['cache_hit_rate'] <= 0:
                 results['errors'].append("Invalid performance metrics")
-                
-        except Exception as e:
-            results['errors'].append(f"Exception: {str(e)}")
         
         return results
     
-    def test_security_features(self) -> Dict[str, Any]:
+    def test_security_features(self, work_dir: Path) -> Dict[str, Any]:
         """Test security enhancements."""
-        test_name = "Security Features"
-        self.logger.log_info(f"Testing: {test_name}")
-        
-        results = {
-            'test_name': test_name,
-            'passed': False,
-            'details': {},
-            'errors': []
-        }
-        
-        try:
-            file_manager = FileManager(str(self.temp_dir / "output"))
+        with self._test("Security Features") as results:
+            file_manager = FileManager(str(work_dir / "output"))
             
             # Test path sanitization
             try:
                 # Test valid path
-                test_image = self.temp_dir / "test_images" / "valid.jpg"
+                test_image = work_dir / "test_images" / "valid.jpg"
                 self.create_test_image(test_image)
                 sanitized = file_manager.sanitize_path(str(test_image))
                 results['details']['path_sanitization'] = 'PASSED'
@@ -222,41 +286,254 @@ class EnhancementTester:
                 if not permissions_ok or not type_ok:
                     results['errors'].append("File validation failed")
             
-            # Test ZIP password protection
+            if self._should_stop(results):
+                return results
+            
+            # Test ZIP password protection, building the archive in memory
             try:
-                zip_path = file_manager.export_to_zip(
-                    str(self.temp_dir / "test_images"),
-                    password="test123"
-                )
-                if zip_path:
+                with _ZIP64_LIMIT_LOCK:
+                    zip_buffer = file_manager.export_to_zip(
+                        str(work_dir / "test_images"),
+                        zip_path=io.BytesIO(),
+                        password="test123"
+                    )
+                if zip_buffer and zip_buffer.getvalue().startswith(b'PK\x03\x04'):
                     results['details']['zip_password_protection'] = 'PASSED'
                 else:
                     results['errors'].append("ZIP password protection failed")
             except Exception as e:
                 results['errors'].append(f"ZIP export failed: {str(e)}")
+        
+        return results
+    
+    def test_zip_round_trip(self, work_dir: Path) -> Dict[str, Any]:
+        """Test that every ZIP writer path reproduces the source files byte for byte."""
+        with self._test("ZIP Round Trip") as results:
+            source_dir = work_dir / "test_images"
+            (source_dir / "album").mkdir()
+            
+            # Already-compressed, incompressible, compressible and non-ASCII-named entries
+            files = {
+                'photo.jpg': _encode_image_bytes((100, 100), 'red', '.jpg'),
+                'noise.bin': os.urandom(256 * 1024),
+                'notes.txt': b'picture finder\n' * 4096,
+                'album/фото_été.jpg': _encode_image_bytes((64, 48), 'blue', '.jpg'),
+            }
+            for name, data in files.items():
+                (source_dir / name).write_bytes(data)
+            
+            file_manager = FileManager(str(work_dir / "output"))
+            variants = {
+                'deflate': {},
+                'parallel_deflate': {'max_workers': 2},
+                'stored': {'compression': zipfile.ZIP_STORED},
+            }
+            results['details']['raw_zip_writes'] = RAW_ZIP_WRITES_SUPPORTED
+            
+            for variant, options in variants.items():
+                for zip64 in (False, True):
+                    name = f"{variant}_zip64" if zip64 else variant
+                    
+                    # A lowered ZIP64_LIMIT makes every entry take the ZIP64 code path
+                    # without writing gigabytes of data
+                    with _ZIP64_LIMIT_LOCK:
+                        original_limit = zipfile.ZIP64_LIMIT
+                        if zip64:
+                            zipfile.ZIP64_LIMIT = 1024
+                        try:
+                            zip_buffer = file_manager.export_to_zip(
+                                str(source_dir), zip_path=io.BytesIO(), **options
+                            )
+                        finally:
+                            zipfile.ZIP64_LIMIT = original_limit
+                    
+                    error = self._check_zip_contents(zip_buffer, files)
+                    if error:
+                        results['errors'].append(f"{name}: {error}")
+                    else:
+                        results['details'][name] = 'PASSED'
+                    
+                    if self._should_stop(results):
+                        return results
+            
+            # Files above the parallel size limit are streamed in-process between
+            # the worker-compressed ones
+            mixed_manager = FileManager(str(work_dir / "output"))
+            mixed_manager.PARALLEL_DEFLATE_MAX_SIZE = 32 * 1024
+            with _ZIP64_LIMIT_LOCK:
+                zip_buffer = mixed_manager.export_to_zip(
+                    str(source_dir), zip_path=io.BytesIO(), max_workers=2
+                )
             
-            results['passed'] = len(results['errors']) == 0
+            error = self._check_zip_contents(zip_buffer, files)
+            if error:
+                results['errors'].append(f"parallel_deflate_streamed_large: {error}")
+            else:
+                results['details']['parallel_deflate_streamed_large'] = 'PASSED'
             
-        except Exception as e:
-            results['errors'].append(f"Exception: {str(e)}")
+            # An export that fails part-way must not leave a preallocated partial archive
+            partial_zip = work_dir / "output" / "interrupted.zip"
+            
+            def interrupt(done: int, total: int):
+                raise RuntimeError("export interrupted")
+            
+            with _ZIP64_LIMIT_LOCK:
+                exported = file_manager.export_to_zip(
+                    str(source_dir), str(partial_zip), progress_callback=interrupt
+                )
+            
+            if exported is None and not partial_zip.exists():
+                results['details']['failed_export_cleanup'] = 'PASSED'
+            else:
+                results['errors'].append("Failed export left a partial archive behind")
         
         return results
     
-    def test_configuration_management(self) -> Dict[str, Any]:
-        """Test configuration management system."""
-        test_name = "Configuration Management"
-        self.logger.log_info(f"Testing: {test_name}")
+    def test_archive_formats(self, work_dir: Path) -> Dict[str, Any]:
+        """Test the tar.gz and 7z exporters against the ZIP exporter's entry names."""
+        with self._test("Archive Formats") as results:
+            source_dir = work_dir / "test_images"
+            (source_dir / "album").mkdir()
+            outside_dir = work_dir / "elsewhere"
+            outside_dir.mkdir()
+            
+            (outside_dir / "more").mkdir()
+            
+            # Some files live outside the exported folder, as after a 'move' run,
+            # and their names clash with each other and with an exported file
+            sources = {
+                source_dir / 'photo.jpg': _encode_image_bytes((100, 100), 'red', '.jpg'),
+                source_dir / 'album' / 'beach.jpg': _encode_image_bytes((64, 48), 'blue', '.jpg'),
+                outside_dir / 'outside.jpg': _encode_image_bytes((32, 32), 'navy', '.jpg'),
+                outside_dir / 'more' / 'outside.jpg': _encode_image_bytes((48, 32), 'navy', '.jpg'),
+                outside_dir / 'photo.jpg': _encode_image_bytes((32, 48), 'red', '.jpg'),
+            }
+            for path, data in sources.items():
+                path.write_bytes(data)
+            file_paths = [str(path) for path in sources]
+            expected_names = ['album/beach.jpg', 'outside.jpg', 'outside_1.jpg', 'photo.jpg', 'photo_1.jpg']
+            
+            file_manager = FileManager(str(work_dir / "output"))
+            
+            # Every format must use the ZIP exporter's archive names
+            with _ZIP64_LIMIT_LOCK:
+                zip_buffer = file_manager.export_to_zip(
+                    str(source_dir), zip_path=io.BytesIO(), file_paths=file_paths
+                )
+            with zipfile.ZipFile(zip_buffer) as archive:
+                expected = {info.filename: archive.read(info) for info in archive.infolist()}
+            
+            # Clashing names are numbered rather than written twice
+            if sorted(expected) == expected_names and set(expected.values()) == set(sources.values()):
+                results['details']['zip_names'] = 'PASSED'
+            else:
+                results['errors'].append(f"ZIP entry names not unique: {sorted(expected)}")
+            
+            if shutil.which('tar') is None:
+                results['details']['tar.gz'] = 'SKIPPED (tar not found)'
+            else:
+                bin_dir = work_dir / "bin"
+                bin_dir.mkdir()
+                tar_path = work_dir / "output" / "export.tar.gz"
+                
+                # A gzip-backed stand-in keeps the test independent of pigz being installed
+                exported = file_manager.export_to_tar_gz(
+                    str(source_dir), str(tar_path), file_paths=file_paths,
+                    env=self._stub_pigz(bin_dir, 'exec gzip "$@"')
+                )
+                
+                if exported:
+                    with tarfile.open(exported, 'r:gz') as archive:
+                        contents = {
+                            member.name: archive.extractfile(member).read()
+                            for member in archive.getmembers() if member.isfile()
+                        }
+                    if contents == expected:
+                        results['details']['tar.gz'] = 'PASSED'
+                    else:
+                        results['errors'].append(f"tar.gz entries differ: {sorted(contents)}")
+                else:
+                    results['errors'].append("tar.gz export failed")
+                
+                # A failing compressor must not leave a partial archive behind
+                failed_path = work_dir / "output" / "failed.tar.gz"
+                exported = file_manager.export_to_tar_gz(
+                    str(source_dir), str(failed_path), file_paths=file_paths,
+                    env=self._stub_pigz(bin_dir, 'cat > /dev/null; exit 1')
+                )
+                
+                if exported is None and not failed_path.exists():
+                    results['details']['tar.gz_failure_cleanup'] = 'PASSED'
+                else:
+                    results['errors'].append("Failed tar.gz export left a partial archive behind")
+            
+            if not PY7ZR_AVAILABLE:
+                results['details']['7z'] = 'SKIPPED (py7zr not installed)'
+            else:
+                import py7zr
+                
+                exported = file_manager.export_to_7z(
+                    str(source_dir), str(work_dir / "output" / "export.7z"), file_paths=file_paths
+                )
+                if exported:
+                    with py7zr.SevenZipFile(exported, 'r') as archive:
+                        contents = {name: data.read() for name, data in archive.readall().items()}
+                    if contents == expected:
+                        results['details']['7z'] = 'PASSED'
+                    else:
+                        results['errors'].append(f"7z entries differ: {sorted(contents)}")
+                else:
+                    results['errors'].append("7z export failed")
         
-        results = {
-            'test_name': test_name,
-            'passed': False,
-            'details': {},
-            'errors': []
-        }
+        return results
+    
+    @staticmethod
+    def _stub_pigz(bin_dir: Path, script: str) -> Dict[str, str]:
+        """
+        Write a shell-script pigz into bin_dir.
         
-        try:
+        The process environment is left alone, since tests run concurrently.
+        
+        Returns:
+            Copy of the environment with bin_dir first on PATH
+        """
+        stub = bin_dir / "pigz"
+        stub.write_text(f"#!/bin/sh\n{script}\n")
+        stub.chmod(0o755)
+        
+        return {**os.environ, 'PATH': f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"}
+    
+    @staticmethod
+    def _check_zip_contents(zip_buffer: Optional[io.BytesIO], files: Dict[str, bytes]) -> Optional[str]:
+        """
+        Compare an exported archive with the files it should contain.
+        
+        Returns:
+            Description of the first problem found, or None if the archive matches
+        """
+        if not zip_buffer:
+            return "export failed"
+        
+        with zipfile.ZipFile(zip_buffer) as archive:
+            bad_entry = archive.testzip()
+            if bad_entry is not None:
+                return f"corrupt entry {bad_entry}"
+            contents = {info.filename: archive.read(info) for info in archive.infolist()}
+        
+        if contents.keys() != files.keys():
+            return f"entries {sorted(contents)} != {sorted(files)}"
+        
+        mismatched = [name for name, data in files.items() if contents[name] != data]
+        if mismatched:
+            return f"contents differ for {', '.join(mismatched)}"
+        
+        return None
+    
+    def test_configuration_management(self, work_dir: Path) -> Dict[str, Any]:
+        """Test configuration management system."""
+        with self._test("Configuration Management") as results:
             # Test configuration creation and loading
-            config_file = self.temp_dir / "test_config.json"
+            config_file = work_dir / "test_config.json"
             config = ConfigManager(str(config_file))
             
             # Test setting updates
@@ -268,6 +545,9 @@ class EnhancementTester:
             else:
                 results['errors'].append("Setting update failed")
             
+            if self._should_stop(results):
+                return results
+            
             # Test configuration save/load
             if config.save_config():
                 new_config = ConfigManager(str(config_file))
@@ -278,39 +558,41 @@ class EnhancementTester:
             else:
                 results['errors'].append("Configuration save failed")
             
+            # Test reloading: a same-size rewrite straight after a load must be picked up,
+            # even when the filesystem timestamp does not change
+            config.load_config()
+            config_file.write_text(config_file.read_text().replace(
+                '"similarity_threshold": 15', '"similarity_threshold": 25'))
+            config.load_config()
+            
+            if config.performance.similarity_threshold == 25:
+                results['details']['reload'] = 'PASSED'
+            else:
+                results['errors'].append("Configuration reload returned stale settings")
+            
             # Test validation
             validation_issues = config.validate_settings()
             results['details']['validation'] = validation_issues
-            
-            results['passed'] = len(results['errors']) == 0
-            
-        except Exception as e:
-            results['errors'].append(f"Exception: {str(e)}")
         
         return results
     
-    def test_enhanced_processing(self) -> Dict[str, Any]:
+    def test_enhanced_processing(self, work_dir: Path) -> Dict[str, Any]:
         """Test enhanced image processing workflow."""
-        test_name = "Enhanced Processing"
-        self.logger.log_info(f"Testing: {test_name}")
-        
-        results = {
-            'test_name': test_name,
-            'passed': False,
-            'details': {},
-            'errors': []
-        }
-        
-        try:
+        with self._test("Enhanced Processing") as results:
             # Create test images
-            test_images_dir = self.temp_dir / "test_images"
+            test_images_dir = work_dir / "test_images"
             
             # Create original and duplicate
             original = test_images_dir / "original.jpg"
             duplicate = test_images_dir / "duplicate.jpg"
             
             self.create_test_image(original, color='blue')
-            shutil.copy2(original, duplicate)  # Exact duplicate
+            
+            # Exact duplicate; a hard link shares the bytes without copying them
+            try:
+                os.link(original, duplicate)
+            except (OSError, AttributeError):
+                shutil.copy2(original, duplicate)
             
             # Create similar image
             similar = test_images_dir / "similar.jpg"
@@ -318,7 +600,7 @@ class EnhancementTester:
             
             # Test processing
             processor = ImageProcessor(
-                output_dir=str(self.temp_dir / "output"),
+                output_dir=str(work_dir / "output"),
                 performance_mode='high',
                 hash_algorithm='average'
             )
@@ -331,65 +613,78 @@ class EnhancementTester:
             
             if processing_results:
                 results['details']['processing_results'] = processing_results
-                results['passed'] = True
             else:
                 results['errors'].append("Processing failed")
-                
-        except Exception as e:
-            results['errors'].append(f"Exception: {str(e)}")
         
         return results
     
-    def run_all_tests(self) -> Dict[str, Any]:
-        """Run all enhancement tests."""
+    def run_all_tests(self, only: Optional[Set[str]] = None) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Run all enhancement tests.
+        
+        Args:
+            only: Short names (see TESTS) of the tests to run; all tests if None
+            
+        Yields:
+            Tuple of (test result, running totals) as each test completes, so in
+            completion order rather than TESTS order
+        """
         self.logger.log_info("=== Starting Picture Finder Enhancement Tests ===")
         
-        try:
-            self.setup_test_environment()
-            
-            # Run individual tests
-            test_results = []
-            
-            test_results.append(self.test_hash_algorithm_plugins())
-            test_results.append(self.test_performance_monitoring())
-            test_results.append(self.test_security_features())
-            test_results.append(self.test_configuration_management())
-            test_results.append(self.test_enhanced_processing())
-            
-            # Compile summary
-            total_tests = len(test_results)
-            passed_tests = sum(1 for result in test_results if result['passed'])
-            
-            summary = {
-                'total_tests': total_tests,
-                'passed_tests': passed_tests,
-                'failed_tests': total_tests - passed_tests,
-                'success_rate': (passed_tests / total_tests) * 100 if total_tests > 0 else 0,
-                'test_details': test_results
-            }
+        with self.setup_test_environment():
+            # Run individual tests concurrently, each in its own directory
+            tests = [
+                getattr(self, method_name)
+                for name, method_name in self.TESTS.items()
+                if only is None or name in only
+            ]
+            work_dirs = {test: self.create_work_dir(test.__name__) for test in tests}
+            
+            total_tests = 0
+            passed_tests = 0
+            
+            with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+                futures = [executor.submit(test, work_dirs[test]) for test in tests]
+                
+                for future in as_completed(futures):
+                    result = future.result()
+                    total_tests += 1
+                    passed_tests += result['passed']
+                    
+                    yield result, {
+                        'total_tests': total_tests,
+                        'passed_tests': passed_tests,
+                        'failed_tests': total_tests - passed_tests,
+                        'success_rate': (passed_tests / total_tests) * 100
+                    }
             
             self.logger.log_info(f"Tests completed: {passed_tests}/{total_tests} passed")
-            
-            return summary
-            
-        finally:
-            self.cleanup_test_environment()
     
-    def print_results(self, results: Dict[str, Any]):
-        """Print formatted test results."""
+    def print_results(self, results: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]],
+                      report_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Print formatted test results as they arrive.
+        
+        Args:
+            results: (test result, running totals) pairs from run_all_tests()
+            report_path: Optional file to write the full results to as JSON
+            
+        Returns:
+            Final totals
+        """
         print("\n" + "="*60)
         print("PICTURE FINDER ENHANCEMENT TEST RESULTS")
         print("="*60)
         
-        print(f"Total Tests: {results['total_tests']}")
-        print(f"Passed: {results['passed_tests']}")
-        print(f"Failed: {results['failed_tests']}")
-        print(f"Success Rate: {results['success_rate']:.1f}%")
-        
         print("\nDETAILED RESULTS:")
         print("-" * 40)
         
-        for test in results['test_details']:
+        summary = {'total_tests': 0, 'passed_tests': 0, 'failed_tests': 0, 'success_rate': 0}
+        details = []
+        for test, summary in results:
+            if report_path:
+                details.append(test)
+            
             status = "✓ PASSED" if test['passed'] else "✗ FAILED"
             print(f"\n{test['test_name']}: {status}")
             
@@ -403,14 +698,45 @@ class EnhancementTester:
                 for error in test['errors']:
                     print(f"    - {error}")
         
+        print("\n" + "-" * 40)
+        print(f"Total Tests: {summary['total_tests']}")
+        print(f"Passed: {summary['passed_tests']}")
+        print(f"Failed: {summary['failed_tests']}")
+        print(f"Success Rate: {summary['success_rate']:.1f}%")
+        
         print("\n" + "="*60)
+        
+        if report_path:
+            # Results arrive in completion order; sort them so reports from different runs diff cleanly
+            details.sort(key=lambda test: test['test_name'])
+            Path(report_path).write_bytes(_dumps({**summary, 'test_details': details}))
+        
+        return summary
 
 
 def main():
     """Main test execution."""
-    tester = EnhancementTester()
-    results = tester.run_all_tests()
-    tester.print_results(results)
+    parser = argparse.ArgumentParser(description="Run the Picture Finder enhancement tests.")
+    parser.add_argument(
+        '--only',
+        type=lambda value: set(value.split(',')),
+        help=f"Comma-separated tests to run ({', '.join(EnhancementTester.TESTS)})"
+    )
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help="Stop each test at its first error instead of running its remaining checks"
+    )
+    args = parser.parse_args()
+    
+    if args.only is not None and not args.only <= EnhancementTester.TESTS.keys():
+        parser.error(f"unknown test(s): {', '.join(sorted(args.only - EnhancementTester.TESTS.keys()))}")
+    
+    tester = EnhancementTester(fail_fast=args.fail_fast)
+    results = tester.print_results(
+        tester.run_all_tests(args.only),
+        report_path=os.environ.get('PICFINDER_TEST_REPORT')
+    )
     
     # Return exit code based on results
     return 0 if results['failed_tests'] == 0 else 1